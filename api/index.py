@@ -3,6 +3,4 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from bwb_scanner.api import app
-
-app = app
+from bwb_scanner.api import app  # noqa: E402,F401  (Vercel serves this ASGI app)
@@ -0,0 +1,251 @@
+"""
+Compiled numeric kernels for BWB construction.
+
+Kernels are resolved in order of preference:
+1. Numba JIT compilation (parallel) with an on-disk cache
+2. A vectorized NumPy implementation (`HAS_COMPILED` is False)
+"""
+
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import prange
+except ImportError:
+    prange = range
+
+
+def _prune_arrays(
+    ask: np.ndarray,
+    delta: np.ndarray,
+    dte: np.ndarray,
+    min_dte: float,
+    max_dte: float,
+    min_delta: float,
+    max_delta: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Precompute the search-space bounds shared by both kernels.
+
+    Returns:
+        Tuple of (ascending indices of short strikes passing the DTE and
+        delta filters, minimum ask strictly above each strike). Since
+        credit = 2*bid[j] - ask[i] - ask[k], a (k1, k2) pair whose credit
+        against the cheapest k3 misses `min_credit` has no valid k3.
+    """
+    n = ask.shape[0]
+    short_idx = np.nonzero(
+        (min_dte <= dte) & (dte <= max_dte) &
+        (min_delta <= delta) & (delta <= max_delta)
+    )[0]
+    min_ask_after = np.empty(n, dtype=np.float64)
+    lowest = np.inf
+    for k in range(n - 1, -1, -1):
+        min_ask_after[k] = lowest
+        if ask[k] < lowest:
+            lowest = ask[k]
+    return short_idx, min_ask_after
+
+
+def _find_combos(
+    strike: np.ndarray,
+    bid: np.ndarray,
+    ask: np.ndarray,
+    delta: np.ndarray,
+    dte: np.ndarray,
+    min_dte: float,
+    max_dte: float,
+    min_delta: float,
+    max_delta: float,
+    min_credit: float
+) -> Tuple[np.ndarray, ...]:
+    """
+    Enumerate all valid k1 < k2 < k3 strike triples.
+
+    Mirrors `BWBConstructor._build_position`: DTE and delta are taken from
+    the short (k2) strike, wings must be asymmetric and the net credit must
+    meet `min_credit`. Metrics are unrounded. Only short strikes passing
+    the filters are visited, and the k3 loop is skipped for (k1, k2) pairs
+    that cannot reach `min_credit`.
+
+    Args:
+        strike: Sorted unique strikes (float64)
+        bid: Bid price per strike (float64)
+        ask: Ask price per strike (float64)
+        delta: Delta per strike (float64)
+        dte: Days to expiration per strike (float64)
+        min_dte: Minimum days to expiration
+        max_dte: Maximum days to expiration
+        min_delta: Minimum delta for short strike
+        max_delta: Maximum delta for short strike
+        min_credit: Minimum net credit required
+
+    Returns:
+        Tuple of (i, j, k, credit, max_profit, max_loss, score) arrays
+        with one entry per valid triple
+    """
+    n = strike.shape[0]
+    short_idx, min_ask_after = _prune_arrays(
+        ask, delta, dte, min_dte, max_dte, min_delta, max_delta
+    )
+
+    # Pass 1: count valid triples per long-strike index i (parallel over i)
+    counts = np.zeros(n, dtype=np.int64)
+    for i in prange(n):
+        c = 0
+        for jj in range(np.searchsorted(short_idx, i + 1), short_idx.shape[0]):
+            j = short_idx[jj]
+            if not ((2 * bid[j]) - ask[i] - min_ask_after[j] >= min_credit):
+                continue
+            wing_left = strike[j] - strike[i]
+            for k in range(j + 1, n):
+                wing_right = strike[k] - strike[j]
+                if abs(wing_left - wing_right) <= 0.001:
+                    continue
+                credit = (2 * bid[j]) - ask[i] - ask[k]
+                if credit >= min_credit:
+                    c += 1
+        counts[i] = c
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    for i in range(n):
+        offsets[i + 1] = offsets[i] + counts[i]
+    total = offsets[n]
+
+    out_i = np.empty(total, dtype=np.int64)
+    out_j = np.empty(total, dtype=np.int64)
+    out_k = np.empty(total, dtype=np.int64)
+    out_credit = np.empty(total, dtype=np.float64)
+    out_profit = np.empty(total, dtype=np.float64)
+    out_loss = np.empty(total, dtype=np.float64)
+    out_score = np.empty(total, dtype=np.float64)
+
+    # Pass 2: each i fills its own slice, preserving (i, j, k) order
+    for i in prange(n):
+        pos = offsets[i]
+        for jj in range(np.searchsorted(short_idx, i + 1), short_idx.shape[0]):
+            j = short_idx[jj]
+            if not ((2 * bid[j]) - ask[i] - min_ask_after[j] >= min_credit):
+                continue
+            wing_left = strike[j] - strike[i]
+            for k in range(j + 1, n):
+                wing_right = strike[k] - strike[j]
+                if abs(wing_left - wing_right) <= 0.001:
+                    continue
+                credit = (2 * bid[j]) - ask[i] - ask[k]
+                if not (credit >= min_credit):
+                    continue
+                max_profit = (credit + wing_left) * 100
+                upside_loss = (wing_right - wing_left - credit) * 100
+                downside_loss = -credit * 100 if credit < 0 else 0.0
+                max_loss = max(0.0, upside_loss, downside_loss)
+                if max_loss <= 0:
+                    score = 100.0
+                else:
+                    score = (max_profit / max_loss) * 100
+
+                out_i[pos] = i
+                out_j[pos] = j
+                out_k[pos] = k
+                out_credit[pos] = credit
+                out_profit[pos] = max_profit
+                out_loss[pos] = max_loss
+                out_score[pos] = score
+                pos += 1
+
+    return out_i, out_j, out_k, out_credit, out_profit, out_loss, out_score
+
+
+def _find_combos_numpy(
+    strike: np.ndarray,
+    bid: np.ndarray,
+    ask: np.ndarray,
+    delta: np.ndarray,
+    dte: np.ndarray,
+    min_dte: float,
+    max_dte: float,
+    min_delta: float,
+    max_delta: float,
+    min_credit: float
+) -> Tuple[np.ndarray, ...]:
+    """
+    Vectorized NumPy equivalent of `_find_combos`.
+
+    Precomputes every (k2, k3) pair whose short strike passes the DTE and
+    delta filters, then vectorizes over those pairs once per long strike
+    k1, keeping only pairs that can still reach `min_credit`. Working
+    memory stays O(n^2) and triples come out in the same (i, j, k) order
+    as the loop.
+
+    Returns:
+        Tuple of (i, j, k, credit, max_profit, max_loss, score) arrays
+    """
+    n = strike.shape[0]
+    short_idx, min_ask_after = _prune_arrays(
+        ask, delta, dte, min_dte, max_dte, min_delta, max_delta
+    )
+    valid_k2 = np.zeros(n, dtype=bool)
+    valid_k2[short_idx] = True
+    pair_j, pair_k = np.triu_indices(n, 1)
+    short_pairs = valid_k2[pair_j]
+    pair_j, pair_k = pair_j[short_pairs], pair_k[short_pairs]
+    pair_bid = 2 * bid[pair_j]
+    pair_min_ask = min_ask_after[pair_j]
+    pair_wing_right = strike[pair_k] - strike[pair_j]
+
+    # Pairs are sorted by j, so those with j > i form a suffix
+    empty = np.empty(0, dtype=np.int64)
+    parts = [(empty, empty, empty, np.empty(0), np.empty(0), np.empty(0))]
+    for i in range(n):
+        tail = slice(np.searchsorted(pair_j, i + 1), None)
+        reachable = pair_bid[tail] - ask[i] - pair_min_ask[tail] >= min_credit
+        j = pair_j[tail][reachable]
+        k = pair_k[tail][reachable]
+        wing_left = strike[j] - strike[i]
+        wing_right = pair_wing_right[tail][reachable]
+        credit = pair_bid[tail][reachable] - ask[i] - ask[k]
+        keep = (np.abs(wing_left - wing_right) > 0.001) & (credit >= min_credit)
+        parts.append((
+            np.full(np.count_nonzero(keep), i, dtype=np.int64), j[keep], k[keep],
+            credit[keep], wing_left[keep], wing_right[keep]
+        ))
+    i, j, k, credit, wing_left, wing_right = (
+        np.concatenate(column) for column in zip(*parts)
+    )
+
+    max_profit, max_loss, score = _metrics_numpy(credit, wing_left, wing_right)
+
+    return i, j, k, credit, max_profit, max_loss, score
+
+
+def _metrics_numpy(
+    credit: np.ndarray,
+    wing_left: np.ndarray,
+    wing_right: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized max profit, max loss and score for arrays of positions.
+
+    Returns:
+        Tuple of (max_profit, max_loss, score) arrays
+    """
+    max_profit = (credit + wing_left) * 100
+    max_loss = np.maximum(
+        np.maximum(0.0, (wing_right - wing_left - credit) * 100),
+        np.where(credit < 0, -credit * 100, 0.0)
+    )
+    score = np.full(max_loss.shape, 100.0)
+    np.divide(max_profit, max_loss, out=score, where=max_loss > 0)
+    np.multiply(score, 100, out=score, where=max_loss > 0)
+    return max_profit, max_loss, score
+
+
+try:
+    from numba import njit
+except ImportError:
+    find_combos = _find_combos_numpy
+    HAS_COMPILED = False
+else:
+    _prune_arrays = njit(cache=True)(_prune_arrays)
+    find_combos = njit(cache=True, parallel=True)(_find_combos)
+    HAS_COMPILED = True
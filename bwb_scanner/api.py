@@ -1,11 +1,24 @@
-from typing import Annotated, Optional
-from collections import OrderedDict
-from fastapi import FastAPI, Body
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from functools import lru_cache
+from fastapi import FastAPI, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from .strategy import BWBConstructor
-from .data_generator import OptionsChainGenerator
-import pandas as pd
+from fastapi.responses import Response
+from cachetools import LRUCache
+from pydantic import BaseModel, Field
+import hashlib
+import orjson
 import os
+import re
+import threading
+
+# Scans run in the server's worker threads, and numba's TBB threading layer
+# hangs at interpreter exit when first launched from one, so prefer OpenMP.
+# Numba reads this when first imported (lazily, by the first scan)
+os.environ.setdefault("NUMBA_THREADING_LAYER_PRIORITY", "omp tbb workqueue")
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from .strategy import BWBConstructor
 
 app = FastAPI(
     title="BWB Scanner API",
@@ -35,26 +48,96 @@ SUPPORTED_TICKERS = {
     "AMD": 125.0,
 }
 
-def _generate_chain_data() -> pd.DataFrame:
+def _generate_chain_data() -> "pd.DataFrame":
     """Generate options chain data for all supported tickers."""
-    all_chains = []
-    for ticker, spot_price in SUPPORTED_TICKERS.items():
+    import pandas as pd
+    from concurrent.futures import ThreadPoolExecutor
+    from .data_generator import OptionsChainGenerator
+
+    def generate(ticker: str, spot_price: float) -> pd.DataFrame:
         generator = OptionsChainGenerator(ticker=ticker)
-        chain = generator.generate_chain(spot_price=spot_price, num_strikes=15)
-        all_chains.append(chain)
+        return generator.generate_chain(spot_price=spot_price, num_strikes=15)
+
+    workers = min(len(SUPPORTED_TICKERS), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        all_chains = list(executor.map(
+            generate, SUPPORTED_TICKERS.keys(), SUPPORTED_TICKERS.values()
+        ))
     return pd.concat(all_chains, ignore_index=True)
 
-_chain_data = _generate_chain_data()
-_constructor = BWBConstructor()
+# Chain data and derived lookups are built lazily on the first scan so that
+# lightweight endpoints (/, /health) respond without importing pandas.
+_chain_data: Optional["pd.DataFrame"] = None
+_constructor: Optional["BWBConstructor"] = None
+_chain_arrays: Dict = {}
+_expiries_by_sym: Dict[str, List[str]] = {}
+_chain_lock = threading.Lock()
+
+
+def _ensure_chain_loaded() -> None:
+    """Generate chain data, partition it and warm the scan cache once."""
+    if _chain_data is None:
+        # Scan handlers run in the threadpool, so concurrent first requests
+        # wait here for a single load
+        with _chain_lock:
+            if _chain_data is None:
+                _load_chain()
+
+
+def _load_chain() -> None:
+    """Build the chain lookups, then precompute every unlimited scan."""
+    global _chain_data, _constructor
+    from .strategy import BWBConstructor
+
+    chain_data = _generate_chain_data()
+    _constructor = BWBConstructor()
+    calls = chain_data[chain_data["type"] == "call"]
+    for key, group in calls.groupby(["symbol", "expiry"], sort=False):
+        _chain_arrays[key] = BWBConstructor.chain_to_arrays(group)
+    for symbol in SUPPORTED_TICKERS:
+        _expiries_by_sym[symbol] = sorted(
+            exp for (sym, exp) in _chain_arrays if sym == symbol
+        )
+    _chain_data = chain_data
+
+    _warm_scan_cache()
+
+
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+_scan_cache: LRUCache = LRUCache(
+    maxsize=MAX_CACHE_BYTES,
+    getsizeof=lambda df: int(df.memory_usage(deep=True).sum())
+)
+
+# Serialized "results" array plus summary stats per (TICKER, expiry); only
+# supported tickers and generated expiries are stored, so the key space is
+# bounded by the static chain
+_scan_json_cache: Dict[Tuple[str, Optional[str]], Tuple[bytes, Dict]] = {}
+
+
+@lru_cache(maxsize=256)
+def _combos(ticker: str, expiry: str) -> List[Dict]:
+    """Construct BWB positions for one ticker/expiry of the static chain."""
+    arrays = _chain_arrays.get((ticker, expiry))
+    if arrays is None:
+        return []
+    return _constructor.find_all_combinations_arr(arrays)
+
 
-MAX_CACHE_SIZE = 100
-_scan_cache: OrderedDict = OrderedDict()
+def scan_chain(
+    ticker: str,
+    expiry: Optional[str] = None,
+    limit: Optional[int] = None
+) -> "pd.DataFrame":
+    import numpy as np
+    import pandas as pd
 
-def scan_chain(ticker: str, expiry: Optional[str] = None) -> pd.DataFrame:
-    cache_key = f"{ticker}:{expiry or 'all'}"
-    if cache_key in _scan_cache:
-        _scan_cache.move_to_end(cache_key)
-        return _scan_cache[cache_key]
+    _ensure_chain_loaded()
+    symbol = ticker.upper()
+    cache_key = f"{symbol}:{expiry or 'all'}:{limit or 'all'}"
+    cached = _scan_cache.get(cache_key)
+    if cached is not None:
+        return cached
     
     empty_df = pd.DataFrame(columns=[
         "ticker", "expiry", "dte", "k1", "k2", "k3",
@@ -62,43 +145,106 @@ def scan_chain(ticker: str, expiry: Optional[str] = None) -> pd.DataFrame:
         "max_loss", "score"
     ])
     
-    filtered = _chain_data[_chain_data["symbol"] == ticker.upper()].copy()
-    
-    if filtered.empty:
+    expiries = _expiries_by_sym.get(symbol)
+
+    if not expiries:
         return empty_df
-    
+
     if expiry:
-        filtered = filtered[filtered["expiry"] == expiry]
-    
-    expiries = filtered["expiry"].unique()
-    
-    all_results = []
+        expiries = [expiry] if expiry in expiries else []
+
+    all_rows = []
     for exp in expiries:
-        expiry_data = filtered[filtered["expiry"] == exp]
-        calls_only = expiry_data[expiry_data["type"] == "call"]
-        
-        if calls_only.empty:
-            continue
-            
-        positions = _constructor.find_all_combinations(calls_only)
-        
-        if positions:
-            results_df = pd.DataFrame([pos.to_dict() for pos in positions])
-            all_results.append(results_df)
-    
-    if not all_results:
+        all_rows.extend(_combos(symbol, exp))
+
+    if not all_rows:
         return empty_df
+
+    combined = pd.DataFrame.from_records(all_rows)
+    if limit is not None and limit < len(combined):
+        # Partial selection of the top `limit` scores, then sort only those
+        scores = combined["score"].to_numpy()
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        combined = combined.iloc[top]
+    combined = combined.sort_values("score", ascending=False, ignore_index=True)
     
-    combined = pd.concat(all_results, ignore_index=True)
-    combined = combined.sort_values("score", ascending=False).reset_index(drop=True)
-    
-    if len(_scan_cache) >= MAX_CACHE_SIZE:
-        _scan_cache.popitem(last=False)
-    _scan_cache[cache_key] = combined
+    try:
+        _scan_cache[cache_key] = combined
+    except ValueError:
+        pass  # Larger than the whole cache budget; serve uncached
     
     return combined
 
 
+def _warm_scan_cache() -> None:
+    """Precompute scan results for every supported ticker and expiry."""
+    for ticker, expiries in _expiries_by_sym.items():
+        _scan_payload(ticker)
+        for expiry in expiries:
+            _scan_payload(ticker, expiry)
+
+
+def _scan_payload(
+    ticker: str,
+    expiry: Optional[str] = None,
+    limit: Optional[int] = None
+) -> Tuple[bytes, Dict]:
+    """
+    Return the JSON-encoded results and summary stats for a scan.
+    
+    The summary always describes every qualifying position; with `limit`
+    only the top `limit` of them are encoded, counted by `returned`.
+    """
+    _ensure_chain_loaded()
+    key = (ticker.upper(), expiry)
+    cached = _scan_json_cache.get(key)
+    if cached is None:
+        results = scan_chain(ticker, expiry)
+        if results.empty:
+            summary = {
+                "total_found": 0,
+                "returned": 0,
+                "avg_score": 0.0,
+                "best_score": 0.0,
+                "avg_credit": 0.0
+            }
+        else:
+            summary = {
+                "total_found": len(results),
+                "returned": len(results),
+                "avg_score": round(float(results["score"].mean()), 4),
+                "best_score": round(float(results["score"].max()), 4),
+                "avg_credit": round(float(results["credit"].mean()), 2)
+            }
+        cached = (orjson.dumps(_to_records(results)), summary)
+        expiries = _expiries_by_sym.get(key[0])
+        if expiries and (expiry is None or expiry in expiries):
+            _scan_json_cache[key] = cached
+
+    summary = cached[1]
+    if limit is None or limit >= summary["total_found"]:
+        return cached
+
+    results = scan_chain(ticker, expiry, limit)
+    return (
+        orjson.dumps(_to_records(results)),
+        {**summary, "returned": len(results)}
+    )
+
+
+def _to_records(results: "pd.DataFrame") -> List[Dict]:
+    """Convert a results frame to row dicts via its column arrays."""
+    columns = list(results.columns)
+    values = [results[col].tolist() for col in columns]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+class ScanRequest(BaseModel):
+    """Request body for /scan."""
+
+    ticker: str
+    expiry: Optional[str] = None
+    limit: Optional[int] = Field(default=None, ge=1)
 
 
 @app.get("/")
@@ -114,38 +260,69 @@ async def list_tickers():
     }
 
 
-@app.post("/scan")
-async def scan_bwb(
-    ticker: Annotated[str, Body()],
-    expiry: Annotated[Optional[str], Body()] = None
-):
+SCAN_CACHE_CONTROL = "public, s-maxage=3600, stale-while-revalidate=86400"
+
+# One entity-tag (weak or strong) or "*" from an If-None-Match list
+_ENTITY_TAG = re.compile(r'\*|(?:W/)?("[^"]*")')
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check If-None-Match against `etag` by weak comparison (RFC 9110)."""
+    if not if_none_match:
+        return False
+    return any(
+        match.group(0) == "*" or match.group(1) == etag
+        for match in _ENTITY_TAG.finditer(if_none_match)
+    )
+
+
+def _scan_response(
+    ticker: str,
+    expiry: Optional[str],
+    limit: Optional[int],
+    http_request: Optional[Request] = None
+) -> Response:
+    """
+    Build a /scan response.
+    
+    With `http_request` (GET only) the response is cacheable: it carries an
+    ETag and Cache-Control, and a matching If-None-Match gets a 304.
+    """
     import time
     start = time.time()
-    results = scan_chain(ticker, expiry)
+    results_json, summary = _scan_payload(ticker, expiry, limit)
     scan_time_ms = round((time.time() - start) * 1000)
-    
-    if results.empty:
-        return {
-            "results": [],
-            "summary": {
-                "total_found": 0,
-                "avg_score": 0.0,
-                "best_score": 0.0,
-                "avg_credit": 0.0,
-                "scan_time_ms": scan_time_ms
-            }
-        }
-    
-    return {
-        "results": results.to_dict(orient="records"),
-        "summary": {
-            "total_found": len(results),
-            "avg_score": round(results["score"].mean(), 4),
-            "best_score": round(results["score"].max(), 4),
-            "avg_credit": round(results["credit"].mean(), 2),
-            "scan_time_ms": scan_time_ms
-        }
-    }
+
+    headers = {}
+    if http_request is not None:
+        etag = f'"{hashlib.md5(results_json).hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": SCAN_CACHE_CONTROL}
+        if _etag_matches(http_request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+    body = b"".join([
+        b'{"results":', results_json,
+        b',"summary":', orjson.dumps({**summary, "scan_time_ms": scan_time_ms}),
+        b"}"
+    ])
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Plain `def` handlers run in FastAPI's threadpool, keeping the first scan's
+# chain generation and the CPU-bound scans off the event loop
+@app.post("/scan")
+def scan_bwb(request: ScanRequest):
+    return _scan_response(request.ticker, request.expiry, request.limit)
+
+
+@app.get("/scan")
+def scan_bwb_get(
+    http_request: Request,
+    ticker: str,
+    expiry: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1)
+):
+    return _scan_response(ticker, expiry, limit, http_request)
 
 
 @app.get("/health")
@@ -20,7 +20,7 @@ class OptionsChainGenerator:
             seed: Random seed for reproducibility
         """
         self.ticker = ticker
-        np.random.seed(seed)
+        self._rng = np.random.RandomState(seed)
     
     def _generate_strikes(
         self,
@@ -49,117 +49,121 @@ class OptionsChainGenerator:
     
     def _calculate_delta(
         self,
-        strike: float,
+        strike: np.ndarray,
         spot_price: float,
-        option_type: str,
-        dte: int
-    ) -> float:
+        is_call: np.ndarray,
+        dte: np.ndarray
+    ) -> np.ndarray:
         """
         Calculate approximate delta using simplified model.
         
+        All array arguments are broadcast against each other.
+        
         Args:
-            strike: Strike price
+            strike: Strike prices
             spot_price: Current spot price
-            option_type: "call" or "put"
+            is_call: True for calls, False for puts
             dte: Days to expiration
             
         Returns:
-            Approximate delta value
+            Approximate delta values
         """
         # Simplified delta calculation
         moneyness = (spot_price - strike) / spot_price
         time_factor = np.sqrt(dte / 365.0)
         
-        if option_type == "call":
-            # Calls: delta increases as strike decreases
-            base_delta = 0.5 + (moneyness * 2.0)
-            delta = base_delta * (1 - 0.3 * time_factor)
-        else:
-            # Puts: delta decreases as strike increases
-            base_delta = -0.5 + (moneyness * 2.0)
-            delta = base_delta * (1 - 0.3 * time_factor)
+        # Calls: delta increases as strike decreases
+        # Puts: delta decreases as strike increases
+        base_delta = np.where(is_call, 0.5, -0.5) + (moneyness * 2.0)
+        delta = base_delta * (1 - 0.3 * time_factor)
         
         # Clamp delta to valid range
-        if option_type == "call":
-            delta = np.clip(delta, 0.01, 0.99)
-        else:
-            delta = np.clip(delta, -0.99, -0.01)
+        delta = np.where(
+            is_call,
+            np.clip(delta, 0.01, 0.99),
+            np.clip(delta, -0.99, -0.01)
+        )
         
-        return round(delta, 4)
+        return np.round(delta, 4)
     
     def _calculate_iv(
         self,
-        strike: float,
+        strike: np.ndarray,
         spot_price: float,
-        dte: int,
+        dte: np.ndarray,
+        shape: tuple,
         base_iv: float = 0.20
-    ) -> float:
+    ) -> np.ndarray:
         """
         Calculate implied volatility with volatility smile.
         
         Args:
-            strike: Strike price
+            strike: Strike prices
             spot_price: Current spot price
             dte: Days to expiration
+            shape: Output shape (one noise draw per option)
             base_iv: Base implied volatility
             
         Returns:
-            Implied volatility
+            Implied volatilities
         """
-        moneyness = abs(strike - spot_price) / spot_price
+        moneyness = np.abs(strike - spot_price) / spot_price
         smile_factor = 1.0 + (moneyness * 0.5)
         
-        term_factor = 1.0 + 0.05 / max(1, np.sqrt(dte / 30))
+        term_factor = 1.0 + 0.05 / np.maximum(1, np.sqrt(dte / 30))
         
         iv = base_iv * smile_factor * term_factor
         
-        noise = np.random.normal(0, 0.01)
+        noise = self._rng.normal(0, 0.01, size=shape)
         iv = iv + noise
         
-        return round(max(0.05, min(1.5, iv)), 4)
+        return np.round(np.clip(iv, 0.05, 1.5), 4)
     
     def _calculate_option_price(
         self,
-        strike: float,
+        strike: np.ndarray,
         spot_price: float,
-        option_type: str,
-        dte: int,
-        iv: float
+        is_call: np.ndarray,
+        dte: np.ndarray,
+        iv: np.ndarray
     ) -> tuple:
         """
         Calculate approximate option bid/ask prices.
         
         Args:
-            strike: Strike price
+            strike: Strike prices
             spot_price: Current spot price
-            option_type: "call" or "put"
+            is_call: True for calls, False for puts
             dte: Days to expiration
-            iv: Implied volatility
+            iv: Implied volatilities
             
         Returns:
-            Tuple of (bid, ask, mid)
+            Tuple of (bid, ask, mid) arrays
         """
         # Simplified Black-Scholes approximation
-        intrinsic = max(0, spot_price - strike) if option_type == "call" else max(0, strike - spot_price)
+        intrinsic = np.where(
+            is_call,
+            np.maximum(0, spot_price - strike),
+            np.maximum(0, strike - spot_price)
+        )
         
         # Time value based on IV and DTE
         time_value = iv * spot_price * np.sqrt(dte / 365.0) * 0.4
         
         # Adjust time value based on moneyness
-        moneyness = abs(strike - spot_price) / spot_price
-        if moneyness > 0.1:  # OTM
-            time_value *= (1 - moneyness)
+        moneyness = np.abs(strike - spot_price) / spot_price
+        time_value = np.where(moneyness > 0.1, time_value * (1 - moneyness), time_value)
         
         mid_price = intrinsic + time_value
         
         # Add bid-ask spread (wider for lower prices)
-        spread_pct = 0.02 if mid_price > 1.0 else 0.05
-        spread = max(0.01, mid_price * spread_pct)
+        spread_pct = np.where(mid_price > 1.0, 0.02, 0.05)
+        spread = np.maximum(0.01, mid_price * spread_pct)
         
-        bid = max(0.01, mid_price - spread / 2)
+        bid = np.maximum(0.01, mid_price - spread / 2)
         ask = mid_price + spread / 2
         
-        return round(bid, 2), round(ask, 2), round(mid_price, 2)
+        return np.round(bid, 2), np.round(ask, 2), np.round(mid_price, 2)
     
     def generate_chain(
         self,
@@ -182,35 +186,40 @@ class OptionsChainGenerator:
             dte_list = [3, 5, 7, 10]
         
         strikes = self._generate_strikes(spot_price, num_strikes)
-        
-        rows = []
         base_date = datetime.now()
-        
-        for dte in dte_list:
-            expiry_date = (base_date + timedelta(days=dte)).strftime("%Y-%m-%d")
-            
-            for strike in strikes:
-                for option_type in ["call", "put"]:
-                    delta = self._calculate_delta(strike, spot_price, option_type, dte)
-                    iv = self._calculate_iv(strike, spot_price, dte)
-                    bid, ask, mid = self._calculate_option_price(
-                        strike, spot_price, option_type, dte, iv
-                    )
-                    
-                    rows.append({
-                        "symbol": self.ticker,
-                        "expiry": expiry_date,
-                        "dte": dte,
-                        "strike": strike,
-                        "type": option_type,
-                        "bid": bid,
-                        "ask": ask,
-                        "mid": mid,
-                        "delta": delta,
-                        "iv": iv
-                    })
-        
-        df = pd.DataFrame(rows)
+        expiries = [
+            (base_date + timedelta(days=dte)).strftime("%Y-%m-%d")
+            for dte in dte_list
+        ]
+        
+        # Rows are ordered dte -> strike -> (call, put); axes follow that order
+        dte = np.asarray(dte_list, dtype=np.int64)[:, None, None]
+        strike = np.asarray(strikes, dtype=np.int64)[None, :, None]
+        is_call = np.array([True, False])[None, None, :]
+        shape = (len(dte_list), len(strikes), 2)
+        
+        delta = self._calculate_delta(strike, spot_price, is_call, dte)
+        iv = self._calculate_iv(strike, spot_price, dte, shape)
+        bid, ask, mid = self._calculate_option_price(
+            strike, spot_price, is_call, dte, iv
+        )
+        
+        # Strikes, prices and deltas stay float64: in float32 values such as
+        # 0.30 or a 0.50 credit land off the filter boundaries. dte is integral
+        # and mid/iv are never read by the scan, so those are narrowed.
+        size = int(np.prod(shape))
+        df = pd.DataFrame({
+            "symbol": [self.ticker] * size,
+            "expiry": np.repeat(expiries, len(strikes) * 2),
+            "dte": np.broadcast_to(dte, shape).ravel().astype(np.int32),
+            "strike": np.broadcast_to(strike, shape).ravel(),
+            "type": np.broadcast_to(np.where(is_call, "call", "put"), shape).ravel(),
+            "bid": np.broadcast_to(bid, shape).ravel(),
+            "ask": np.broadcast_to(ask, shape).ravel(),
+            "mid": np.broadcast_to(mid, shape).ravel().astype(np.float32),
+            "delta": np.broadcast_to(delta, shape).ravel(),
+            "iv": iv.ravel().astype(np.float32)
+        })
         return df
     
     def save_to_csv(self, df: pd.DataFrame, filename: str) -> None:
@@ -4,9 +4,24 @@ Handles reading and validating options chain data from CSV files.
 """
 
 from typing import Optional
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+HAS_PYARROW = pa is not None
+
 
 class OptionsChainLoader:
     """Loads and validates options chain data from CSV files."""
@@ -16,14 +31,42 @@ class OptionsChainLoader:
         "bid", "ask", "mid", "delta", "iv"
     ]
     
-    def __init__(self, csv_path: str):
+    # Option types, in categorical code order
+    OPTION_TYPES = ["call", "put"]
+    
+    # Label columns are always read as text (e.g. expiry is not a date);
+    # numeric columns are inferred and coerced in _validate_data_types
+    CSV_DTYPES = {"symbol": str, "expiry": str, "type": str}
+    
+    # SQL expression per column for the DuckDB reader; numeric casts mirror
+    # pd.to_numeric(errors="coerce") by yielding NULL on bad values. dte is
+    # cast to DOUBLE too, since INTEGER would round "5.5" up to 6.
+    SQL_COLUMNS = {
+        "symbol": "upper(symbol)",
+        "expiry": "expiry",
+        "dte": "TRY_CAST(dte AS DOUBLE)",
+        "strike": "TRY_CAST(strike AS DOUBLE)",
+        "type": "lower(type)",
+        "bid": "TRY_CAST(bid AS DOUBLE)",
+        "ask": "TRY_CAST(ask AS DOUBLE)",
+        "mid": "TRY_CAST(mid AS DOUBLE)",
+        "delta": "TRY_CAST(delta AS DOUBLE)",
+        "iv": "TRY_CAST(iv AS DOUBLE)",
+    }
+    
+    def __init__(self, csv_path: str, use_cache: bool = False):
         """
         Initialize the loader with a CSV file path.
         
         Args:
             csv_path: Path to the options chain CSV file
+            use_cache: Persist the validated chain as Parquet next to the
+                CSV and reuse it while it is newer than the CSV (requires
+                pyarrow)
         """
         self.csv_path = Path(csv_path)
+        self.cache_path = self.csv_path.with_suffix(".parquet")
+        self.use_cache = use_cache and HAS_PYARROW
         self._validate_file_exists()
     
     def _validate_file_exists(self) -> None:
@@ -49,29 +92,48 @@ class OptionsChainLoader:
         """
         Validate and convert data types.
         
+        Columns are converted in place; `load` owns the frame it just read,
+        so no defensive copy is made.
+        
         Args:
             df: DataFrame to validate
             
         Returns:
             DataFrame with corrected types
         """
-        df = df.copy()
-        
-        # Numeric columns
+        # Numeric columns (already typed when read through DuckDB)
         numeric_cols = ["dte", "strike", "bid", "ask", "mid", "delta", "iv"]
         for col in numeric_cols:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+        
+        # Prices and greeks are float64 whichever reader parsed them
+        # (pandas and PyArrow infer int64 for whole-number strikes)
+        float_cols = ["strike", "bid", "ask", "mid", "delta", "iv"]
+        df[float_cols] = df[float_cols].astype(np.float64)
         
-        # String columns
+        # String columns (missing labels arrive as None from DuckDB and
+        # PyArrow but NaN from pandas; unify them before stringifying)
+        labels = ["symbol", "type", "expiry"]
+        df[labels] = df[labels].where(df[labels].notna(), np.nan)
         df["symbol"] = df["symbol"].astype(str).str.upper()
-        df["type"] = df["type"].astype(str).str.lower()
         df["expiry"] = df["expiry"].astype(str)
         
-        # Validate option types
-        valid_types = {"call", "put"}
-        invalid_types = set(df["type"].unique()) - valid_types
-        if invalid_types:
+        # Validate option types against the fixed categories in one pass
+        # over the integer codes; anything else (including missing) is -1
+        option_types = pd.Categorical(
+            df["type"].astype(str).str.lower(), categories=self.OPTION_TYPES
+        )
+        invalid = option_types.codes < 0
+        if invalid.any():
+            invalid_types = set(df["type"].astype(str).str.lower()[invalid])
             raise ValueError(f"Invalid option types found: {invalid_types}")
+        df["type"] = option_types
+        
+        # Low-cardinality labels are stored as categoricals so equality
+        # filters compare integer codes instead of Python strings
+        for col in ["symbol", "expiry"]:
+            df[col] = df[col].astype("category")
         
         return df
     
@@ -87,19 +149,27 @@ class OptionsChainLoader:
         """
         initial_len = len(df)
         
-        # Remove rows with negative prices
-        df = df[(df["bid"] >= 0) & (df["ask"] >= 0) & (df["strike"] > 0)]
-        
-        # Remove rows where bid > ask (invalid market data)
-        df = df[df["bid"] <= df["ask"]]
+        bid = df["bid"].to_numpy()
+        ask = df["ask"].to_numpy()
+        strike = df["strike"].to_numpy()
+        dte = df["dte"].to_numpy()
+        delta = df["delta"].to_numpy()
+        type_codes = df["type"].cat.codes.to_numpy()
+        is_call = type_codes == self.OPTION_TYPES.index("call")
+        is_put = type_codes == self.OPTION_TYPES.index("put")
         
-        # Remove rows with invalid DTE (must be >= 0)
-        df = df[df["dte"] >= 0]
-        
-        # Remove rows with invalid delta for calls (0-1) and puts (-1 to 0)
-        calls_valid = (df["type"] == "call") & (df["delta"] >= 0) & (df["delta"] <= 1)
-        puts_valid = (df["type"] == "put") & (df["delta"] >= -1) & (df["delta"] <= 0)
-        df = df[calls_valid | puts_valid]
+        # Non-negative prices, positive strike, bid <= ask, DTE >= 0, and
+        # delta in [0, 1] for calls or [-1, 0] for puts, applied in one slice
+        mask = (
+            (bid >= 0) & (ask >= 0) & (strike > 0) &
+            (bid <= ask) &
+            (dte >= 0) &
+            (
+                (is_call & (delta >= 0) & (delta <= 1)) |
+                (is_put & (delta >= -1) & (delta <= 0))
+            )
+        )
+        df = df.loc[mask]
         
         removed = initial_len - len(df)
         if removed > 0:
@@ -108,6 +178,62 @@ class OptionsChainLoader:
         
         return df
     
+    def _read_csv(self) -> pd.DataFrame:
+        """
+        Read the CSV file, casting columns in DuckDB when it is installed.
+        
+        Only the required columns are parsed, so unused columns are never
+        materialized. Without DuckDB, PyArrow's multithreaded CSV reader is
+        used, then `pd.read_csv`.
+        
+        Returns:
+            Raw options chain DataFrame
+        """
+        if duckdb is None:
+            header = pd.read_csv(self.csv_path, nrows=0)
+            if set(self.REQUIRED_COLUMNS) - set(header.columns):
+                # Let _validate_columns report the missing columns
+                return header
+            if pacsv is not None:
+                # Parse straight from the page cache rather than a read copy
+                with pa.memory_map(str(self.csv_path)) as source:
+                    table = pacsv.read_csv(
+                        source,
+                        read_options=pacsv.ReadOptions(block_size=8 << 20),
+                        convert_options=pacsv.ConvertOptions(
+                            include_columns=self.REQUIRED_COLUMNS,
+                            column_types={
+                                col: pa.string() for col in self.CSV_DTYPES
+                            },
+                            strings_can_be_null=True
+                        )
+                    )
+                # Release Arrow buffers column by column during conversion
+                return table.to_pandas(split_blocks=True, self_destruct=True)
+            return pd.read_csv(
+                self.csv_path,
+                usecols=self.REQUIRED_COLUMNS,
+                dtype=self.CSV_DTYPES,
+                memory_map=True
+            )
+        
+        con = duckdb.connect()
+        try:
+            source = "read_csv_auto(?, all_varchar = true)"
+            params = [str(self.csv_path)]
+            header = con.execute(f"SELECT * FROM {source} LIMIT 0", params)
+            present = [column[0] for column in header.description]
+            if set(self.REQUIRED_COLUMNS) - set(present):
+                # Let _validate_columns report the missing columns
+                return pd.DataFrame(columns=present)
+            select = ", ".join(
+                f"{self.SQL_COLUMNS[col]} AS {col}"
+                for col in self.REQUIRED_COLUMNS
+            )
+            return con.execute(f"SELECT {select} FROM {source}", params).df()
+        finally:
+            con.close()
+    
     def load(self) -> pd.DataFrame:
         """
         Load and validate the options chain data.
@@ -119,7 +245,73 @@ class OptionsChainLoader:
             FileNotFoundError: If CSV file doesn't exist
             ValueError: If data validation fails
         """
-        df = pd.read_csv(self.csv_path)
+        if self._cache_is_fresh():
+            return pd.read_parquet(self.cache_path)
+        
+        df = self._validate(self._read_csv())
+        
+        if self.use_cache:
+            try:
+                df.to_parquet(self.cache_path)
+            except OSError:
+                pass  # Unwritable location; serve uncached
+        
+        return df
+    
+    def load_ticker(self, ticker: str, chunk_rows: int) -> pd.DataFrame:
+        """
+        Stream the CSV in chunks, keeping only one ticker's rows.
+        
+        Each chunk is validated like `load` and reduced to the ticker before
+        the next is read, so peak memory is bounded by `chunk_rows` plus the
+        ticker's own rows rather than the whole file.
+        
+        Args:
+            ticker: Ticker symbol to keep
+            chunk_rows: Number of CSV rows parsed per chunk
+            
+        Returns:
+            Validated DataFrame with the ticker's options
+            
+        Raises:
+            ValueError: If data validation fails
+        """
+        header = pd.read_csv(self.csv_path, nrows=0)
+        self._validate_columns(header)
+        
+        symbol = ticker.upper()
+        parts = []
+        for chunk in pd.read_csv(
+            self.csv_path,
+            usecols=self.REQUIRED_COLUMNS,
+            dtype=self.CSV_DTYPES,
+            chunksize=chunk_rows,
+            memory_map=True
+        ):
+            chunk = self._validate(chunk)
+            parts.append(chunk[chunk["symbol"] == symbol])
+        
+        if not parts:
+            return self._validate(header[self.REQUIRED_COLUMNS])
+        
+        # Chunks carry their own symbol and expiry categories (option types
+        # share fixed ones); re-categorize the joined frame
+        df = pd.concat(parts)
+        return df.astype({col: "category" for col in ["symbol", "expiry"]})
+    
+    def _validate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply every validation and cleaning step to freshly read data.
+        
+        Args:
+            df: DataFrame as read from the CSV
+            
+        Returns:
+            Validated DataFrame
+            
+        Raises:
+            ValueError: If data validation fails
+        """
         self._validate_columns(df)
         df = self._validate_data_types(df)
         
@@ -129,8 +321,25 @@ class OptionsChainLoader:
         # Validate market data integrity
         df = self._validate_market_data(df)
         
+        # Shrink columns that downcast losslessly (integral DTE) or feed no
+        # filter or metric (mid, iv); strike, bid, ask and delta stay float64
+        # so threshold comparisons and rounded results are unchanged
+        df = df.assign(
+            dte=pd.to_numeric(df["dte"], downcast="integer"),
+            mid=pd.to_numeric(df["mid"], downcast="float"),
+            iv=pd.to_numeric(df["iv"], downcast="float")
+        )
+        
         return df
     
+    def _cache_is_fresh(self) -> bool:
+        """Check whether the Parquet cache exists and postdates the CSV."""
+        return (
+            self.use_cache and
+            self.cache_path.exists() and
+            self.cache_path.stat().st_mtime >= self.csv_path.stat().st_mtime
+        )
+    
     def filter_by_ticker_and_expiry(
         self, 
         df: pd.DataFrame, 
@@ -148,10 +357,35 @@ class OptionsChainLoader:
         Returns:
             Filtered DataFrame
         """
-        return df[
-            (df["symbol"] == ticker.upper()) & 
-            (df["expiry"] == expiry)
-        ].copy()
+        symbol, expiries = df["symbol"], df["expiry"]
+        if (
+            isinstance(symbol.dtype, pd.CategoricalDtype) and
+            isinstance(expiries.dtype, pd.CategoricalDtype)
+        ):
+            mask = (
+                self._category_mask(symbol, ticker.upper()) &
+                self._category_mask(expiries, expiry)
+            )
+        else:
+            mask = (symbol == ticker.upper()) & (expiries == expiry)
+        return df[mask].copy()
+    
+    @staticmethod
+    def _category_mask(column: pd.Series, value: str) -> np.ndarray:
+        """
+        Match a categorical column against one value by its integer code.
+        
+        Args:
+            column: Categorical Series
+            value: Category to match
+            
+        Returns:
+            Boolean array, all False if value is not a category
+        """
+        categories = column.cat.categories
+        if value not in categories:
+            return np.zeros(len(column), dtype=bool)
+        return column.cat.codes.to_numpy() == categories.get_loc(value)
     
     def filter_calls_only(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -163,4 +397,6 @@ class OptionsChainLoader:
         Returns:
             DataFrame with only call options
         """
+        if isinstance(df["type"].dtype, pd.CategoricalDtype):
+            return df[self._category_mask(df["type"], "call")].copy()
         return df[df["type"] == "call"].copy()
\ No newline at end of file
@@ -2,12 +2,38 @@
 Main BWB scanner module that orchestrates the scanning process.
 """
 
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import multiprocessing
+import os
+import numpy as np
 import pandas as pd
 from .data_loader import OptionsChainLoader
 from .strategy import BWBConstructor, BWBValidator
 
 
+@lru_cache(maxsize=2)
+def _parse_chain(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """
+    Load and validate a chain once per file version (`use_cache` only).
+    
+    Keyed on the file's modification time and size so an edited CSV is
+    re-parsed. The frame is shared between caching scanners and must not
+    be modified in place.
+    """
+    return OptionsChainLoader(path, use_cache=True).load()
+
+
+def _find_combinations_cols(
+    arrays: Dict[str, np.ndarray],
+    validator: BWBValidator
+) -> Dict[str, np.ndarray]:
+    """Construct one expiry's positions (module-level so workers can pickle it)."""
+    return BWBConstructor(validator).find_all_combinations_cols(arrays)
+
+
 class BWBScanner:
     """
     Main scanner class that coordinates data loading, 
@@ -17,7 +43,8 @@ class BWBScanner:
     def __init__(
         self,
         csv_path: str,
-        validator: Optional[BWBValidator] = None
+        validator: Optional[BWBValidator] = None,
+        use_cache: bool = False
     ):
         """
         Initialize scanner with data source and validator.
@@ -25,19 +52,60 @@ class BWBScanner:
         Args:
             csv_path: Path to options chain CSV file
             validator: Optional BWBValidator instance
+            use_cache: Reuse a Parquet cache of the validated chain
+                (see `OptionsChainLoader`), and share the loaded frame
+                with other caching scanners on the same file version
         """
-        self.loader = OptionsChainLoader(csv_path)
+        self.loader = OptionsChainLoader(csv_path, use_cache=use_cache)
         self.constructor = BWBConstructor(validator)
         self.chain_data: Optional[pd.DataFrame] = None
+        self._indexed_data: Optional[pd.DataFrame] = None
+        self._chains: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
     
     def load_data(self) -> None:
-        """Load and validate options chain data."""
-        self.chain_data = self.loader.load()
+        """
+        Load and validate options chain data.
+        
+        With `use_cache` the frame is parsed once per file version and
+        shared between scanners, so it must not be modified in place;
+        otherwise every call loads a private copy.
+        """
+        if self.loader.use_cache:
+            # abspath normalizes the cache key lexically; resolve() would
+            # lstat every path component on each call
+            path = os.path.abspath(self.loader.csv_path)
+            stat = os.stat(path)
+            self.chain_data = _parse_chain(path, stat.st_mtime_ns, stat.st_size)
+        else:
+            self.chain_data = self.loader.load()
+        self._chain_index()
+    
+    def _chain_index(self) -> Dict[Tuple[str, str], Dict[str, np.ndarray]]:
+        """
+        Map each (symbol, expiry) to the column arrays of its call chain.
+        
+        Built with a single groupby over the loaded calls and rebuilt only
+        when `chain_data` is replaced. Keys keep first-appearance order.
+        
+        Returns:
+            Dictionary mapping (symbol, expiry) to `chain_to_arrays` output
+        """
+        if self._indexed_data is not self.chain_data:
+            calls = self.loader.filter_calls_only(self.chain_data)
+            self._chains = {
+                (str(symbol), str(expiry)): BWBConstructor.chain_to_arrays(group)
+                for (symbol, expiry), group in calls.groupby(
+                    ["symbol", "expiry"], sort=False, observed=True
+                )
+            }
+            self._indexed_data = self.chain_data
+        return self._chains
     
     def scan(
         self,
         ticker: str,
-        expiry: str
+        expiry: str,
+        top_k: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Scan for valid BWB positions for a given ticker and expiry.
@@ -45,82 +113,138 @@ class BWBScanner:
         Args:
             ticker: Ticker symbol to scan
             expiry: Expiry date to scan
+            top_k: Optional number of best-scoring positions to keep
             
         Returns:
             DataFrame with valid BWB positions sorted by score (best first)
+            
+        Raises:
+            ValueError: If top_k is less than 1
         """
+        self._check_top_k(top_k)
         if self.chain_data is None:
             self.load_data()
         
-        # Filter chain for ticker and expiry
-        filtered_chain = self.loader.filter_by_ticker_and_expiry(
-            self.chain_data,
-            ticker,
-            expiry
-        )
-        
-        if filtered_chain.empty:
-            return self._create_empty_result()
-        
-        # Filter for calls only
-        calls_chain = self.loader.filter_calls_only(filtered_chain)
-        
-        if calls_chain.empty:
+        columns = self._scan_arrays(ticker, expiry)
+        if columns is None:
             return self._create_empty_result()
+        return self._columns_to_frame(columns, top_k)
+    
+    def _scan_arrays(
+        self,
+        ticker: str,
+        expiry: str
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Find all valid BWB combinations for one ticker and expiry.
         
-        # Find all valid BWB combinations
-        positions = self.constructor.find_all_combinations(calls_chain)
+        Args:
+            ticker: Ticker symbol to scan
+            expiry: Expiry date to scan
+            
+        Returns:
+            Position column arrays, or None if the chain has no such calls
+        """
+        arrays = self._chain_index().get((ticker.upper(), str(expiry)))
+        if arrays is None:
+            return None
+        return self.constructor.find_all_combinations_cols(arrays)
+    
+    def _columns_to_frame(
+        self,
+        columns: Dict[str, np.ndarray],
+        top_k: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Build the score-sorted results frame from position column arrays.
         
-        if not positions:
+        Args:
+            columns: Output of `BWBConstructor.find_all_combinations_cols`
+            top_k: Optional number of best-scoring positions to keep
+            
+        Returns:
+            DataFrame with positions sorted by score (best first)
+        """
+        if len(columns["score"]) == 0:
             return self._create_empty_result()
         
-        # Convert to DataFrame
-        results_df = pd.DataFrame([pos.to_dict() for pos in positions])
+        score = columns["score"]
+        if top_k is not None and top_k < len(score):
+            # Partial selection of the top `top_k` scores, then sort only those
+            top = np.sort(np.argpartition(-score, top_k - 1)[:top_k])
+            columns = {key: values[top] for key, values in columns.items()}
+            score = columns["score"]
         
-        # Sort by score (best first)
-        results_df = results_df.sort_values("score", ascending=False)
-        results_df = results_df.reset_index(drop=True)
+        # Sort by score (best first); ties keep their construction order
+        order = np.argsort(-score, kind="stable")
+        results_df = pd.DataFrame(
+            {key: values[order] for key, values in columns.items()}
+        )
         
         return results_df
     
-    def scan_all_expiries(self, ticker: str) -> pd.DataFrame:
+    def scan_all_expiries(
+        self,
+        ticker: str,
+        top_k: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> pd.DataFrame:
         """
         Scan for valid BWB positions across all expiries for a ticker.
         
         Args:
             ticker: Ticker symbol to scan
+            top_k: Optional number of best-scoring positions to keep
+            max_workers: Scan expiries in up to this many worker processes
+                (sequential when None or 1)
             
         Returns:
             DataFrame with all valid BWB positions sorted by score
+            
+        Raises:
+            ValueError: If top_k is less than 1
         """
+        self._check_top_k(top_k)
         if self.chain_data is None:
             self.load_data()
         
-        # Get all expiries for this ticker
-        ticker_data = self.chain_data[
-            self.chain_data["symbol"] == ticker.upper()
+        # Get all expiries with calls for this ticker
+        symbol = ticker.upper()
+        expiries: List[str] = [
+            exp for (sym, exp) in self._chain_index() if sym == symbol
         ]
         
-        if ticker_data.empty:
-            return self._create_empty_result()
-        
-        expiries = ticker_data["expiry"].unique()
+        if max_workers is not None and max_workers > 1 and len(expiries) > 1:
+            # Spawned (not forked) workers: the compiled kernel's OpenMP
+            # runtime is not fork-safe once initialized in this process
+            index = self._chain_index()
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(expiries)),
+                mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                expiry_columns = list(executor.map(
+                    _find_combinations_cols,
+                    [index[(symbol, exp)] for exp in expiries],
+                    repeat(self.constructor.validator)
+                ))
+        else:
+            expiry_columns = [self._scan_arrays(symbol, exp) for exp in expiries]
         
-        all_results = []
-        for expiry in expiries:
-            expiry_results = self.scan(ticker, expiry)
-            if not expiry_results.empty:
-                all_results.append(expiry_results)
-        
-        if not all_results:
+        if not expiry_columns:
             return self._create_empty_result()
         
-        # Combine all results
-        combined_df = pd.concat(all_results, ignore_index=True)
-        combined_df = combined_df.sort_values("score", ascending=False)
-        combined_df = combined_df.reset_index(drop=True)
-        
-        return combined_df
+        # Join the per-expiry columns once, then select and sort together
+        combined = {
+            key: np.concatenate([columns[key] for columns in expiry_columns])
+            for key in expiry_columns[0]
+        }
+        return self._columns_to_frame(combined, top_k)
+    
+    @staticmethod
+    def _check_top_k(top_k: Optional[int]) -> None:
+        """Validate the optional top-K result count."""
+        if top_k is not None and top_k < 1:
+            raise ValueError(f"top_k must be at least 1, got {top_k}")
     
     def _create_empty_result(self) -> pd.DataFrame:
         """Create an empty DataFrame with correct columns."""
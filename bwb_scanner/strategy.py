@@ -2,15 +2,41 @@
 BWB (Broken Wing Butterfly) strategy validation and construction module.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
+from . import _kernels
+
+
+def _round(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Round an array exactly as Python's built-in `round` rounds each float.
+    
+    `np.round` scales before rounding, which can tip values lying within
+    floating-point error of a half-way point; those few are rounded with
+    `round` itself.
+    """
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+    near_half = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    if near_half.any():
+        rounded[near_half] = [round(x, ndigits) for x in values[near_half].tolist()]
+    return rounded
 
 
 @dataclass
 class BWBPosition:
     """Represents a single BWB position with all strikes and metrics."""
     
+    # Explicit slots (dataclass(slots=True) needs Python 3.10) drop the
+    # per-instance __dict__ from the many positions a scan can build
+    __slots__ = (
+        "ticker", "expiry", "dte", "k1", "k2", "k3", "wing_left",
+        "wing_right", "credit", "max_profit", "max_loss", "score"
+    )
+    
     ticker: str
     expiry: str
     dte: int
@@ -86,6 +112,50 @@ class BWBValidator:
     def is_valid_credit(self, credit: float) -> bool:
         """Check if credit meets minimum requirement."""
         return credit >= self.min_credit
+    
+    def validate_batch(
+        self,
+        dte: np.ndarray,
+        delta: np.ndarray,
+        credit: np.ndarray,
+        wing_left: np.ndarray,
+        wing_right: np.ndarray
+    ) -> np.ndarray:
+        """
+        Apply all four checks to arrays of candidate positions at once.
+        
+        Args:
+            dte: Days to expiration of each short strike
+            delta: Delta of each short strike
+            credit: Net credit of each position
+            wing_left: Left wing widths (K2 - K1)
+            wing_right: Right wing widths (K3 - K2)
+            
+        Returns:
+            Boolean mask, True where the position passes every check
+        """
+        dte, delta, credit = np.asarray(dte), np.asarray(delta), np.asarray(credit)
+        return (
+            (self.min_dte <= dte) & (dte <= self.max_dte) &
+            (self.min_delta <= delta) & (delta <= self.max_delta) &
+            (np.abs(np.subtract(wing_left, wing_right)) > 0.001) &
+            (credit >= self.min_credit)
+        )
+    
+    def kernel_thresholds(self) -> Tuple[float, float, float, float, float]:
+        """
+        Constraint values as floats, in `_kernels.find_combos` argument order.
+        
+        Passing floats keeps a single compiled kernel specialization whether
+        the thresholds were given as ints or floats.
+        """
+        return (
+            float(self.min_dte),
+            float(self.max_dte),
+            float(self.min_delta),
+            float(self.max_delta),
+            float(self.min_credit)
+        )
 
 
 class BWBCalculator:
@@ -156,11 +226,75 @@ class BWBCalculator:
         if max_loss <= 0:
             return 100.0
         return (max_profit / max_loss) * 100
+    
+    @staticmethod
+    def payoff_curve(
+        spots: np.ndarray,
+        k1: float,
+        k2: float,
+        k3: float,
+        credit: float
+    ) -> np.ndarray:
+        """
+        Calculate P&L at expiration across a grid of underlying prices.
+        
+        Args:
+            spots: Underlying prices at expiration
+            k1: Long call strike 1
+            k2: Short call strike
+            k3: Long call strike 2
+            credit: Net credit received
+            
+        Returns:
+            P&L in dollars at each spot
+        """
+        spots = np.asarray(spots, dtype=np.float64)
+        intrinsic = (
+            np.maximum(0.0, spots - k1)
+            - 2 * np.maximum(0.0, spots - k2)
+            + np.maximum(0.0, spots - k3)
+        )
+        return (credit + intrinsic) * 100
+    
+    @staticmethod
+    def evaluate_batch(
+        ask_k1: np.ndarray,
+        bid_k2: np.ndarray,
+        ask_k3: np.ndarray,
+        wing_left: np.ndarray,
+        wing_right: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate credit, max profit, max loss and score for many positions.
+        
+        Array equivalent of the scalar `calculate_*` methods, sharing the
+        NumPy kernel's metric code so results match it exactly.
+        
+        Args:
+            ask_k1: Ask prices at K1
+            bid_k2: Bid prices at K2
+            ask_k3: Ask prices at K3
+            wing_left: Left wing widths (K2 - K1)
+            wing_right: Right wing widths (K3 - K2)
+            
+        Returns:
+            Tuple of (credit, max_profit, max_loss, score) arrays
+        """
+        credit = (2 * np.asarray(bid_k2, dtype=np.float64)) - ask_k1 - ask_k3
+        return (credit,) + _kernels._metrics_numpy(
+            credit,
+            np.asarray(wing_left, dtype=np.float64),
+            np.asarray(wing_right, dtype=np.float64)
+        )
 
 
 class BWBConstructor:
     """Constructs and validates BWB positions from options chain."""
     
+    ARRAY_COLUMNS = (
+        "symbol", "expiry", "dte", "strike", "bid", "ask", "mid", "delta", "iv"
+    )
+    
     def __init__(self, validator: Optional[BWBValidator] = None):
         """
         Initialize constructor with validator.
@@ -170,6 +304,29 @@ class BWBConstructor:
         """
         self.validator = validator or BWBValidator()
         self.calculator = BWBCalculator()
+        self._indexed_chain: Optional[pd.DataFrame] = None
+        self._strike_positions: Dict[float, int] = {}
+    
+    def _strike_index(self, chain: pd.DataFrame) -> Dict[float, int]:
+        """
+        Map each strike to the position of its first row in the chain.
+        
+        The index is rebuilt only when a different chain object is passed,
+        so chains must not be mutated in place between lookups.
+        
+        Args:
+            chain: Options chain DataFrame
+            
+        Returns:
+            Dictionary mapping strike to row position
+        """
+        if self._indexed_chain is not chain:
+            positions: Dict[float, int] = {}
+            for pos, strike in enumerate(chain["strike"].tolist()):
+                positions.setdefault(strike, pos)
+            self._indexed_chain = chain
+            self._strike_positions = positions
+        return self._strike_positions
     
     def _get_strike_data(
         self,
@@ -186,10 +343,10 @@ class BWBConstructor:
         Returns:
             Series with option data or None if not found
         """
-        matches = chain[chain["strike"] == strike]
-        if len(matches) == 0:
+        pos = self._strike_index(chain).get(strike)
+        if pos is None:
             return None
-        return matches.iloc[0]
+        return chain.iloc[pos]
     
     def _build_position(
         self,
@@ -276,15 +433,83 @@ class BWBConstructor:
         Returns:
             List of valid BWBPosition objects
         """
-        positions = []
-        strikes = sorted(chain["strike"].unique())
+        arrays = self.chain_to_arrays(chain)
+        return [BWBPosition(**row) for row in self.find_all_combinations_arr(arrays)]
+    
+    @classmethod
+    def chain_to_arrays(cls, chain: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Convert an options chain into per-strike numpy column arrays.
+        
+        Strikes are sorted ascending and de-duplicated, keeping the first
+        row for each strike (the same row `_get_strike_data` would return).
+        
+        Args:
+            chain: Options chain DataFrame (calls only)
+            
+        Returns:
+            Dictionary mapping column name to numpy array
+        """
+        _, first = np.unique(chain["strike"].to_numpy(), return_index=True)
+        return {col: chain[col].to_numpy()[first] for col in cls.ARRAY_COLUMNS}
+    
+    def find_all_combinations_cols(
+        self,
+        arrays: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Find all valid BWB combinations as per-column result arrays.
+        
+        Args:
+            arrays: Column arrays as returned by `chain_to_arrays`
+            
+        Returns:
+            Dictionary mapping each `BWBPosition.to_dict` key to an array
+            with one entry per valid position
+        """
+        strike = np.ascontiguousarray(arrays["strike"], dtype=np.float64)
+        i, j, k, credit, max_profit, max_loss, score = _kernels.find_combos(
+            strike,
+            np.ascontiguousarray(arrays["bid"], dtype=np.float64),
+            np.ascontiguousarray(arrays["ask"], dtype=np.float64),
+            np.ascontiguousarray(arrays["delta"], dtype=np.float64),
+            np.ascontiguousarray(arrays["dte"], dtype=np.float64),
+            *self.validator.kernel_thresholds()
+        )
         
-        # Iterate through all possible combinations
-        for i, k1 in enumerate(strikes):
-            for j, k2 in enumerate(strikes[i+1:], start=i+1):
-                for k3 in strikes[j+1:]:
-                    position = self._build_position(chain, k1, k2, k3)
-                    if position is not None:
-                        positions.append(position)
+        # Integer strikes stay integral, as they would through tolist()
+        if np.issubdtype(arrays["strike"].dtype, np.integer):
+            strike = arrays["strike"].astype(np.int64)
+        k1, k2, k3 = strike[i], strike[j], strike[k]
+        return {
+            "ticker": arrays["symbol"][j].astype(str),
+            "expiry": arrays["expiry"][j].astype(str),
+            "dte": arrays["dte"][j].astype(np.int64),
+            "k1": k1,
+            "k2": k2,
+            "k3": k3,
+            "wing_left": k2 - k1,
+            "wing_right": k3 - k2,
+            "credit": _round(credit, 2),
+            "max_profit": _round(max_profit, 2),
+            "max_loss": _round(max_loss, 2),
+            "score": _round(score, 4)
+        }
+    
+    def find_all_combinations_arr(
+        self,
+        arrays: Dict[str, np.ndarray]
+    ) -> List[Dict]:
+        """
+        Find all valid BWB combinations from per-strike column arrays.
         
-        return positions
\ No newline at end of file
+        Args:
+            arrays: Column arrays as returned by `chain_to_arrays`
+            
+        Returns:
+            List of position dictionaries (same keys as `BWBPosition.to_dict`)
+        """
+        cols = self.find_all_combinations_cols(arrays)
+        keys = list(cols)
+        values = [cols[key].tolist() for key in keys]
+        return [dict(zip(keys, row)) for row in zip(*values)]
@@ -47,9 +47,9 @@ def example_generate_and_scan():
     if not results.empty:
         print("\n4. Top 5 BWB Positions:")
         print("-" * 80)
-        top_5 = results.head(5)
-        for idx, row in top_5.iterrows():
-            print(f"\n   Position #{idx + 1}:")
+        top_5 = results.head(5).to_dict("records")
+        for rank, row in enumerate(top_5, start=1):
+            print(f"\n   Position #{rank}:")
             print(f"   Strikes: {row['k1']:.0f} / {row['k2']:.0f} / {row['k3']:.0f}")
             print(f"   Wings: {row['wing_left']:.0f} x {row['wing_right']:.0f}")
             print(f"   Expiry: {row['expiry']} ({row['dte']} DTE)")
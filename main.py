@@ -4,9 +4,8 @@ Demonstrates usage and provides CLI interface.
 """
 
 import argparse
+import os
 from pathlib import Path
-from bwb_scanner.scanner import BWBScanner
-from bwb_scanner.data_generator import OptionsChainGenerator
 
 
 def start_api_server():
@@ -24,11 +23,15 @@ def start_api_server():
         print("  - Health check: http://localhost:8000/health")
         print("\nPress CTRL+C to stop the server\n")
         
+        # Hot reload only works with a single worker process
+        workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+        
         uvicorn.run(
             "bwb_scanner.api:app",
             host="0.0.0.0",
             port=8000,
-            reload=True
+            reload=workers == 1,
+            workers=workers
         )
     except ImportError:
         print("Error: FastAPI and uvicorn are required to run the API server.")
@@ -43,6 +46,8 @@ def generate_sample_data(output_path: str = "sample_options_chain.csv") -> None:
     Args:
         output_path: Path to save the CSV file
     """
+    from bwb_scanner.data_generator import OptionsChainGenerator
+    
     print("Generating sample options chain data...")
     generator = OptionsChainGenerator(ticker="SPY")
     chain = generator.generate_chain(spot_price=450.0)
@@ -55,7 +60,10 @@ def run_scanner(
     csv_path: str,
     ticker: str,
     expiry: str = None,
-    show_stats: bool = True
+    show_stats: bool = True,
+    chunk_rows: int = None,
+    workers: int = None,
+    output_format: str = "csv"
 ) -> None:
     """
     Run the BWB scanner.
@@ -65,17 +73,27 @@ def run_scanner(
         ticker: Ticker symbol to scan
         expiry: Specific expiry to scan (None for all)
         show_stats: Whether to show summary statistics
+        chunk_rows: Stream the CSV in chunks of this many rows, keeping
+            only the ticker's rows in memory (None loads the whole file)
+        workers: Scan expiries in up to this many worker processes when
+            no expiry is given (None scans them sequentially)
+        output_format: File format for the full results ("csv" or
+            "parquet"; Parquet requires pyarrow)
     """
+    from bwb_scanner.scanner import BWBScanner
+    
     print(f"\nScanning for BWB opportunities in {ticker}...")
     print(f"Data source: {csv_path}\n")
     
     scanner = BWBScanner(csv_path)
+    if chunk_rows:
+        scanner.chain_data = scanner.loader.load_ticker(ticker, chunk_rows)
     
     if expiry:
         results = scanner.scan(ticker, expiry)
         print(f"Scanning expiry: {expiry}")
     else:
-        results = scanner.scan_all_expiries(ticker)
+        results = scanner.scan_all_expiries(ticker, max_workers=workers)
         print("Scanning all available expiries")
     
     print(f"\nFound {len(results)} valid BWB positions\n")
@@ -89,26 +107,43 @@ def run_scanner(
             "ticker", "expiry", "dte", "k1", "k2", "k3",
             "credit", "max_profit", "max_loss", "score"
         ]
-        print(results[display_cols].head(10).to_string(index=False))
+        # Slice before selecting columns so only ten rows are copied
+        print(results.head(10)[display_cols].to_string(index=False))
         
         if show_stats:
-            print("\n" + "=" * 100)
-            print("Summary Statistics:")
-            print("=" * 100)
             stats = scanner.get_summary_stats(results)
-            for key, value in stats.items():
-                print(f"{key.replace('_', ' ').title()}: {value}")
+            lines = ["", "=" * 100, "Summary Statistics:", "=" * 100]
+            lines += [
+                f"{key.replace('_', ' ').title()}: {value}"
+                for key, value in stats.items()
+            ]
+            print("\n".join(lines))
         
-        # Save results to CSV
-        output_file = f"bwb_results_{ticker}.csv"
-        results.to_csv(output_file, index=False)
+        # Save results (Parquet skips text formatting and is much smaller)
+        output_file = f"bwb_results_{ticker}.{output_format}"
+        if output_format == "parquet":
+            results.to_parquet(output_file, index=False)
+        else:
+            results.to_csv(output_file, index=False)
         print(f"\nFull results saved to: {output_file}")
     else:
         print("No valid BWB positions found matching the criteria.")
 
 
+def _has_pyarrow() -> bool:
+    """Check for pyarrow without importing pandas."""
+    from importlib.util import find_spec
+    return find_spec("pyarrow") is not None
+
+
 def main():
-    """Main CLI entry point."""
+    """
+    Main CLI entry point.
+    
+    The scanner and generator modules (and with them pandas and numpy) are
+    imported only by the command that needs them, so `--help`, argument
+    errors and `--api` start quickly.
+    """
     parser = argparse.ArgumentParser(
         description="BWB Scanner - Find Broken Wing Butterfly opportunities",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -122,6 +157,15 @@ Examples:
   
   # Scan specific expiry
   python main.py --csv sample_options_chain.csv --ticker SPY --expiry 2025-11-28
+  
+  # Save the full results as Parquet
+  python main.py --csv sample_options_chain.csv --ticker SPY --output-format parquet
+  
+  # Scan all expiries across 4 worker processes
+  python main.py --csv sample_options_chain.csv --ticker SPY --workers 4
+  
+  # Scan a file larger than memory, 1M rows at a time
+  python main.py --csv full_chain.csv --ticker SPY --chunk-rows 1000000
         """
     )
     
@@ -149,6 +193,27 @@ Examples:
         help="Specific expiry date to scan (YYYY-MM-DD format)"
     )
     
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=None,
+        help="Stream the CSV in chunks of N rows (for files larger than memory)"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Scan expiries in up to N worker processes"
+    )
+    
+    parser.add_argument(
+        "--output-format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="File format for the full results (parquet requires pyarrow)"
+    )
+    
     parser.add_argument(
         "--no-stats",
         action="store_true",
@@ -181,11 +246,19 @@ Examples:
         print(f"Error: CSV file not found: {args.csv}")
         return
     
+    if args.output_format == "parquet" and not _has_pyarrow():
+        print("Error: pyarrow is required for --output-format parquet.")
+        print("Install it with: pip install pyarrow")
+        return
+    
     run_scanner(
         csv_path=args.csv,
         ticker=args.ticker,
         expiry=args.expiry,
-        show_stats=not args.no_stats
+        show_stats=not args.no_stats,
+        chunk_rows=args.chunk_rows,
+        workers=args.workers,
+        output_format=args.output_format
     )
 
 
@@ -0,0 +1,146 @@
+"""
+Tests for the FastAPI scan endpoints.
+"""
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+from bwb_scanner import api
+from bwb_scanner.api import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Test client shared by the module (the chain is generated once)."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class TestScanCaching:
+    """Test ETag and Cache-Control handling on /scan."""
+
+    def test_scan_returns_etag(self, client):
+        """Test a scan responds 200 with an ETag and Cache-Control."""
+        response = client.get("/scan", params={"ticker": "SPY"})
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert "s-maxage" in response.headers["cache-control"]
+        assert len(response.json()["results"]) > 0
+
+    @pytest.mark.parametrize("header", [
+        "{etag}",
+        "W/{etag}",
+        '"stale", {etag}',
+        '"stale",W/{etag}',
+        "*",
+    ])
+    def test_matching_if_none_match_returns_304(self, client, header):
+        """Test strong, weak, listed and wildcard tags all revalidate."""
+        etag = client.get("/scan", params={"ticker": "SPY"}).headers["etag"]
+
+        response = client.get(
+            "/scan",
+            params={"ticker": "SPY"},
+            headers={"If-None-Match": header.format(etag=etag)}
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    def test_other_if_none_match_returns_200(self, client):
+        """Test a non-matching tag gets the full response."""
+        response = client.get(
+            "/scan",
+            params={"ticker": "SPY"},
+            headers={"If-None-Match": '"stale", W/"other"'}
+        )
+
+        assert response.status_code == 200
+
+    def test_get_and_post_match(self, client):
+        """Test GET and POST /scan return the same results."""
+        params = {"ticker": "QQQ", "limit": 5}
+        get = client.get("/scan", params=params)
+        post = client.post("/scan", json=params)
+
+        assert get.status_code == post.status_code == 200
+        assert get.json()["results"] == post.json()["results"]
+
+    def test_post_not_cacheable(self, client):
+        """Test POST /scan sends no cache headers and ignores If-None-Match."""
+        etag = client.get("/scan", params={"ticker": "SPY"}).headers["etag"]
+
+        response = client.post(
+            "/scan", json={"ticker": "SPY"}, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+        assert "cache-control" not in response.headers
+
+
+class TestScanLimit:
+    """Test the optional /scan limit."""
+
+    @staticmethod
+    def scan(client, **params):
+        """GET /scan and return its body without the timing field."""
+        body = client.get("/scan", params=params).json()
+        del body["summary"]["scan_time_ms"]
+        return body
+
+    def test_limit_keeps_full_summary(self, client):
+        """Test a limited scan returns the top positions but counts them all."""
+        full = self.scan(client, ticker="SPY")
+        limited = self.scan(client, ticker="SPY", limit=3)
+
+        total = full["summary"]["total_found"]
+        assert total > 3
+        assert full["summary"]["returned"] == total
+        assert limited["summary"] == {**full["summary"], "returned": 3}
+
+        scores = [row["score"] for row in limited["results"]]
+        top = sorted((row["score"] for row in full["results"]), reverse=True)
+        assert scores == top[:3]
+
+    def test_limit_above_total_returns_everything(self, client):
+        """Test a limit larger than the result count changes nothing."""
+        full = self.scan(client, ticker="SPY")
+        assert self.scan(client, ticker="SPY", limit=10**6) == full
+
+    def test_invalid_limit_rejected(self, client):
+        """Test limit must be at least 1."""
+        assert client.get("/scan", params={"ticker": "SPY", "limit": 0}).status_code == 422
+
+    def test_ticker_case_shares_cache(self, client):
+        """Test lowercase and uppercase tickers share cache entries."""
+        lower = client.get("/scan", params={"ticker": "iwm", "limit": 2})
+        upper = client.get("/scan", params={"ticker": "IWM", "limit": 2})
+
+        assert lower.headers["etag"] == upper.headers["etag"]
+        assert "IWM:all:2" in api._scan_cache
+        assert "iwm:all:2" not in api._scan_cache
+
+
+class TestScanPayloadCache:
+    """Test the serialized scan cache stays bounded."""
+
+    def test_unknown_scans_not_cached(self, client):
+        """Test unknown tickers and expiries are answered but never stored."""
+        client.get("/scan", params={"ticker": "SPY"})
+        size = len(api._scan_json_cache)
+
+        for n in range(20):
+            junk_expiry = client.get(
+                "/scan", params={"ticker": "SPY", "expiry": f"junk-{n}"}
+            )
+            junk_ticker = client.get("/scan", params={"ticker": f"JUNK{n}"})
+            for response in (junk_expiry, junk_ticker):
+                assert response.status_code == 200
+                assert response.json()["summary"]["total_found"] == 0
+
+        assert len(api._scan_json_cache) == size
@@ -0,0 +1,43 @@
+"""
+Throughput benchmarks for BWB construction (requires pytest-benchmark).
+
+Run on their own and compare against a saved baseline with:
+
+    pytest tests/test_benchmarks.py --benchmark-autosave
+    pytest tests/test_benchmarks.py --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+import pytest
+from bwb_scanner.data_generator import OptionsChainGenerator
+from bwb_scanner.strategy import BWBConstructor, BWBValidator
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def large_chain():
+    """Generate one 120-strike call chain (seeded, so runs are comparable)."""
+    chain = OptionsChainGenerator(ticker="SPY").generate_chain(
+        spot_price=450.0, dte_list=[5], num_strikes=120
+    )
+    return chain[chain["type"] == "call"]
+
+
+@pytest.fixture(scope="module")
+def constructor():
+    """Constructor with a permissive credit filter so most triples are kept."""
+    return BWBConstructor(validator=BWBValidator(min_credit=-100.0))
+
+
+def test_find_all_combinations_cols(benchmark, constructor, large_chain):
+    """Benchmark the kernel and columnar result assembly."""
+    arrays = constructor.chain_to_arrays(large_chain)
+    columns = benchmark(constructor.find_all_combinations_cols, arrays)
+    assert len(columns["score"]) > 0
+
+
+def test_find_all_combinations(benchmark, constructor, large_chain):
+    """Benchmark end-to-end construction of BWBPosition objects."""
+    positions = benchmark(constructor.find_all_combinations, large_chain)
+    assert isinstance(positions, list)
+    assert len(positions) > 0
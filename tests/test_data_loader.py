@@ -5,7 +5,6 @@ Tests for data loading and validation.
 import pytest
 import pandas as pd
 from pathlib import Path
-import tempfile
 import os
 from bwb_scanner.data_loader import OptionsChainLoader
 
@@ -13,38 +12,27 @@ from bwb_scanner.data_loader import OptionsChainLoader
 class TestOptionsChainLoader:
     """Test suite for OptionsChainLoader."""
     
-    @pytest.fixture
-    def valid_csv_file(self):
-        """Create a temporary valid CSV file for testing."""
+    @pytest.fixture(scope="session")
+    def valid_csv_file(self, tmp_path_factory):
+        """Write a valid CSV file for testing, once per session."""
         data = """symbol,expiry,dte,strike,type,bid,ask,mid,delta,iv
 SPY,2025-11-30,5,440,call,15.0,15.5,15.25,0.70,0.20
 SPY,2025-11-30,5,445,call,10.0,10.5,10.25,0.30,0.20
 SPY,2025-11-30,5,450,put,5.0,5.5,5.25,-0.25,0.20"""
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            f.write(data)
-            temp_path = f.name
-        
-        yield temp_path
-        
-        # Cleanup
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+        path = tmp_path_factory.mktemp("csvs") / "valid_csv_file.csv"
+        path.write_text(data)
+        return str(path)
     
-    @pytest.fixture
-    def invalid_columns_csv(self):
-        """Create a CSV with missing required columns."""
+    @pytest.fixture(scope="session")
+    def invalid_columns_csv(self, tmp_path_factory):
+        """Write a CSV with missing required columns, once per session."""
         data = """symbol,expiry,strike,type
 SPY,2025-11-30,440,call"""
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            f.write(data)
-            temp_path = f.name
-        
-        yield temp_path
-        
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+        path = tmp_path_factory.mktemp("csvs") / "invalid_columns_csv.csv"
+        path.write_text(data)
+        return str(path)
     
     def test_initialization_valid_file(self, valid_csv_file):
         """Test loader initializes with valid file."""
@@ -83,26 +71,105 @@ SPY,2025-11-30,440,call"""
         assert pd.api.types.is_numeric_dtype(df["bid"])
         assert pd.api.types.is_numeric_dtype(df["delta"])
         
-        # Check string columns
-        assert df["symbol"].dtype == object
-        assert df["type"].dtype == object
+        # Check categorical label columns
+        assert isinstance(df["symbol"].dtype, pd.CategoricalDtype)
+        assert isinstance(df["expiry"].dtype, pd.CategoricalDtype)
+        assert isinstance(df["type"].dtype, pd.CategoricalDtype)
+        assert list(df["type"].cat.categories) == ["call", "put"]
     
-    def test_option_type_validation(self):
+    def test_option_type_validation(self, tmp_path):
         """Test that invalid option types are rejected."""
         data = """symbol,expiry,dte,strike,type,bid,ask,mid,delta,iv
 SPY,2025-11-30,5,440,invalid,15.0,15.5,15.25,0.70,0.20"""
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            f.write(data)
-            temp_path = f.name
+        temp_path = tmp_path / "chain.csv"
+        temp_path.write_text(data)
+        
+        loader = OptionsChainLoader(temp_path)
+        with pytest.raises(ValueError, match="Invalid option types"):
+            loader.load()
+    
+    def test_pandas_fallback_matches(self, valid_csv_file, monkeypatch):
+        """Test that loading without DuckDB or PyArrow yields the same data."""
+        from bwb_scanner import data_loader
+        
+        loader = OptionsChainLoader(valid_csv_file)
+        df = loader.load()
+        
+        monkeypatch.setattr(data_loader, "duckdb", None)
+        arrow = loader.load()
+        monkeypatch.setattr(data_loader, "pacsv", None)
+        fallback = loader.load()
+        
+        for other in (arrow, fallback):
+            pd.testing.assert_frame_equal(
+                df.reset_index(drop=True),
+                other.reset_index(drop=True)
+            )
+    
+    def test_readers_agree_on_fractional_dte(self, tmp_path, monkeypatch):
+        """Test that fractional or malformed DTE parses alike in every reader."""
+        from bwb_scanner import data_loader
+        
+        data = """symbol,expiry,dte,strike,type,bid,ask,mid,delta,iv
+SPY,2025-11-30,5.5,440,call,15.0,15.5,15.25,0.70,0.20
+SPY,2025-11-30,abc,445,call,10.0,10.5,10.25,0.30,0.20
+SPY,2025-11-30,,450,call,5.0,5.5,5.25,0.25,0.20
+SPY,2025-11-30,7,455,call,3.0,3.5,3.25,0.20,0.20"""
+        temp_path = tmp_path / "chain.csv"
+        temp_path.write_text(data)
+        loader = OptionsChainLoader(temp_path)
+        
+        with pytest.warns(UserWarning, match="Removed 2 rows"):
+            df = loader.load()
+        monkeypatch.setattr(data_loader, "duckdb", None)
+        with pytest.warns(UserWarning, match="Removed 2 rows"):
+            arrow = loader.load()
+        monkeypatch.setattr(data_loader, "pacsv", None)
+        with pytest.warns(UserWarning, match="Removed 2 rows"):
+            fallback = loader.load()
+        
+        assert df["dte"].tolist() == [5.5, 7.0]
+        for other in (arrow, fallback):
+            pd.testing.assert_frame_equal(
+                df.reset_index(drop=True),
+                other.reset_index(drop=True)
+            )
+    
+    def test_extra_columns_not_loaded(self, tmp_path):
+        """Test that columns outside REQUIRED_COLUMNS are skipped."""
+        data = """symbol,expiry,dte,strike,type,bid,ask,mid,delta,iv,volume,gamma
+SPY,2025-11-30,5,440,call,15.0,15.5,15.25,0.70,0.20,120,0.01"""
+        
+        temp_path = tmp_path / "chain.csv"
+        temp_path.write_text(data)
         
+        df = OptionsChainLoader(temp_path).load()
+        assert list(df.columns) == OptionsChainLoader.REQUIRED_COLUMNS
+    
+    def test_parquet_cache_reused(self, valid_csv_file):
+        """Test that the validated chain is cached and reused as Parquet."""
+        pytest.importorskip("pyarrow")
+        loader = OptionsChainLoader(valid_csv_file, use_cache=True)
         try:
-            loader = OptionsChainLoader(temp_path)
-            with pytest.raises(ValueError, match="Invalid option types"):
-                loader.load()
+            df = loader.load()
+            assert loader.cache_path.exists()
+            
+            cached = OptionsChainLoader(valid_csv_file, use_cache=True).load()
+            pd.testing.assert_frame_equal(cached, df)
         finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            if loader.cache_path.exists():
+                os.remove(loader.cache_path)
+    
+    def test_load_ticker_in_chunks(self, valid_csv_file):
+        """Test chunked loading keeps only the requested ticker's rows."""
+        loader = OptionsChainLoader(valid_csv_file)
+        df = loader.load()
+        
+        chunked = loader.load_ticker("spy", chunk_rows=1)
+        assert len(chunked) == len(df)
+        assert chunked["strike"].tolist() == df["strike"].tolist()
+        assert len(loader.load_ticker("AAPL", chunk_rows=2)) == 0
     
     def test_filter_by_ticker_and_expiry(self, valid_csv_file):
         """Test filtering by ticker and expiry."""
@@ -127,51 +194,41 @@ SPY,2025-11-30,5,440,invalid,15.0,15.5,15.25,0.70,0.20"""
         assert len(calls) == 2  # Only 2 calls in the sample data
         assert all(calls["type"] == "call")
     
-    def test_case_insensitive_ticker(self):
+    def test_case_insensitive_ticker(self, tmp_path):
         """Test that ticker filtering is case-insensitive."""
         data = """symbol,expiry,dte,strike,type,bid,ask,mid,delta,iv
 spy,2025-11-30,5,440,call,15.0,15.5,15.25,0.70,0.20
 SPY,2025-11-30,5,445,call,10.0,10.5,10.25,0.30,0.20"""
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            f.write(data)
-            temp_path = f.name
+        temp_path = tmp_path / "chain.csv"
+        temp_path.write_text(data)
         
-        try:
-            loader = OptionsChainLoader(temp_path)
-            df = loader.load()
-            
-            # Both should be converted to uppercase
-            assert all(df["symbol"] == "SPY")
-            
-            # Filter should work with any case
-            filtered = loader.filter_by_ticker_and_expiry(df, "spy", "2025-11-30")
-            assert len(filtered) == 2
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        loader = OptionsChainLoader(temp_path)
+        df = loader.load()
+        
+        # Both should be converted to uppercase
+        assert all(df["symbol"] == "SPY")
+        
+        # Filter should work with any case
+        filtered = loader.filter_by_ticker_and_expiry(df, "spy", "2025-11-30")
+        assert len(filtered) == 2
     
-    def test_missing_data_handling(self):
+    def test_missing_data_handling(self, tmp_path):
         """Test that rows with missing critical data are removed."""
         data = """symbol,expiry,dte,strike,type,bid,ask,mid,delta,iv
 SPY,2025-11-30,5,440,call,15.0,15.5,15.25,0.70,0.20
 SPY,2025-11-30,5,445,call,,,10.25,0.30,0.20
 SPY,2025-11-30,5,450,call,10.0,10.5,10.25,,0.20"""
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            f.write(data)
-            temp_path = f.name
+        temp_path = tmp_path / "chain.csv"
+        temp_path.write_text(data)
         
-        try:
-            loader = OptionsChainLoader(temp_path)
-            df = loader.load()
-            
-            # Should only have 1 row (the valid one)
-            assert len(df) == 1
-            assert df["strike"].iloc[0] == 440.0
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        loader = OptionsChainLoader(temp_path)
+        df = loader.load()
+        
+        # Should only have 1 row (the valid one)
+        assert len(df) == 1
+        assert df["strike"].iloc[0] == 440.0
 
 
 class TestDataIntegrity:
@@ -185,26 +242,21 @@ class TestDataIntegrity:
         ]
         assert OptionsChainLoader.REQUIRED_COLUMNS == expected_columns
     
-    def test_option_types_normalized(self):
+    def test_option_types_normalized(self, tmp_path):
         """Test that option types are normalized to lowercase."""
         data = """symbol,expiry,dte,strike,type,bid,ask,mid,delta,iv
 SPY,2025-11-30,5,440,CALL,15.0,15.5,15.25,0.70,0.20
 SPY,2025-11-30,5,445,Call,10.0,10.5,10.25,0.30,0.20
 SPY,2025-11-30,5,450,put,5.0,5.5,5.25,-0.25,0.20"""
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            f.write(data)
-            temp_path = f.name
+        temp_path = tmp_path / "chain.csv"
+        temp_path.write_text(data)
         
-        try:
-            loader = OptionsChainLoader(temp_path)
-            df = loader.load()
-            
-            # All types should be lowercase
-            assert all(df["type"].isin(["call", "put"]))
-            assert df["type"].iloc[0] == "call"
-            assert df["type"].iloc[1] == "call"
-            assert df["type"].iloc[2] == "put"
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
\ No newline at end of file
+        loader = OptionsChainLoader(temp_path)
+        df = loader.load()
+        
+        # All types should be lowercase
+        assert all(df["type"].isin(["call", "put"]))
+        assert df["type"].iloc[0] == "call"
+        assert df["type"].iloc[1] == "call"
+        assert df["type"].iloc[2] == "put"
@@ -4,7 +4,7 @@ Tests for the main BWB scanner functionality.
 
 import pytest
 import pandas as pd
-import tempfile
+import shutil
 import os
 from bwb_scanner.scanner import BWBScanner
 from bwb_scanner.strategy import BWBValidator
@@ -13,9 +13,9 @@ from bwb_scanner.strategy import BWBValidator
 class TestBWBScanner:
     """Test suite for BWBScanner."""
     
-    @pytest.fixture
-    def sample_csv_file(self):
-        """Create a temporary CSV file with sample data."""
+    @pytest.fixture(scope="session")
+    def sample_csv_file(self, tmp_path_factory):
+        """Write a CSV file with sample data, once per session."""
         data = """symbol,expiry,dte,strike,type,bid,ask,mid,delta,iv
 SPY,2025-11-30,5,440,call,14.5,15.5,15.0,0.70,0.20
 SPY,2025-11-30,5,445,call,9.5,10.5,10.0,0.30,0.20
@@ -26,14 +26,9 @@ SPY,2025-12-05,10,445,call,10.5,11.5,11.0,0.32,0.22
 SPY,2025-12-05,10,455,call,3.5,4.5,4.0,0.12,0.22
 AAPL,2025-11-30,5,180,call,7.5,8.5,8.0,0.28,0.25"""
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            f.write(data)
-            temp_path = f.name
-        
-        yield temp_path
-        
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+        path = tmp_path_factory.mktemp("csvs") / "sample_csv_file.csv"
+        path.write_text(data)
+        return str(path)
     
     def test_scanner_initialization(self, sample_csv_file):
         """Test scanner initializes correctly."""
@@ -80,6 +75,53 @@ AAPL,2025-11-30,5,180,call,7.5,8.5,8.0,0.28,0.25"""
         assert isinstance(results, pd.DataFrame)
         assert len(results) == 0
     
+    def test_load_data_reuses_parsed_chain(self, sample_csv_file, tmp_path):
+        """Test caching scanners share one parse per file version."""
+        pytest.importorskip("pyarrow")
+        # The session fixture is shared, so append to a private copy
+        csv_path = tmp_path / "chain.csv"
+        shutil.copy(sample_csv_file, csv_path)
+        first = BWBScanner(csv_path, use_cache=True)
+        second = BWBScanner(csv_path, use_cache=True)
+        first.load_data()
+        second.load_data()
+        assert second.chain_data is first.chain_data
+        
+        with open(csv_path, "a") as f:
+            f.write("\nQQQ,2025-11-30,5,380,call,7.5,8.5,8.0,0.28,0.25")
+        # Coarse filesystem clocks can stamp the append with the Parquet
+        # cache's own mtime, which would still count as fresh
+        stat = csv_path.stat()
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        second.load_data()
+        assert second.chain_data is not first.chain_data
+        assert "QQQ" in set(second.chain_data["symbol"])
+    
+    def test_load_data_private_without_cache(self, sample_csv_file):
+        """Test scanners without use_cache never share a loaded frame."""
+        first = BWBScanner(sample_csv_file)
+        second = BWBScanner(sample_csv_file)
+        first.load_data()
+        second.load_data()
+        assert second.chain_data is not first.chain_data
+        pd.testing.assert_frame_equal(second.chain_data, first.chain_data)
+    
+    def test_chain_index_tracks_chain_data(self, sample_csv_file):
+        """Test per-expiry call chains are indexed once per loaded frame."""
+        scanner = BWBScanner(sample_csv_file)
+        scanner.load_data()
+        
+        index = scanner._chain_index()
+        assert list(index) == [
+            ("SPY", "2025-11-30"), ("SPY", "2025-12-05"), ("AAPL", "2025-11-30")
+        ]
+        assert list(index[("SPY", "2025-11-30")]["strike"]) == [440, 445, 455]
+        
+        scanner.chain_data = scanner.chain_data[
+            scanner.chain_data["symbol"] == "AAPL"
+        ]
+        assert list(scanner._chain_index()) == [("AAPL", "2025-11-30")]
+    
     def test_scan_all_expiries(self, sample_csv_file):
         """Test scanning all expiries for a ticker."""
         scanner = BWBScanner(sample_csv_file)
@@ -100,6 +142,34 @@ AAPL,2025-11-30,5,180,call,7.5,8.5,8.0,0.28,0.25"""
             scores = results["score"].tolist()
             assert scores == sorted(scores, reverse=True)
     
+    def test_top_k_keeps_best_scores(self, sample_csv_file):
+        """Test top_k returns the highest-scoring positions in order."""
+        validator = BWBValidator(min_credit=-100.0, min_delta=0.0, max_delta=1.0)
+        scanner = BWBScanner(sample_csv_file, validator=validator)
+        full = scanner.scan_all_expiries("SPY")
+        assert len(full) > 1
+        
+        top = scanner.scan_all_expiries("SPY", top_k=1)
+        assert len(top) == 1
+        assert top["score"].tolist() == full["score"].head(1).tolist()
+        
+        top = scanner.scan("SPY", "2025-11-30", top_k=len(full) + 10)
+        assert top["score"].tolist() == scanner.scan("SPY", "2025-11-30")["score"].tolist()
+        
+        with pytest.raises(ValueError, match="top_k"):
+            scanner.scan("SPY", "2025-11-30", top_k=0)
+    
+    def test_scan_all_expiries_with_workers(self, sample_csv_file):
+        """Test multi-process scanning matches the sequential scan."""
+        validator = BWBValidator(min_credit=-100.0, min_delta=0.0, max_delta=1.0)
+        scanner = BWBScanner(sample_csv_file, validator=validator)
+        
+        sequential = scanner.scan_all_expiries("SPY")
+        parallel = scanner.scan_all_expiries("SPY", max_workers=2)
+        
+        assert len(sequential) > 0
+        pd.testing.assert_frame_equal(parallel, sequential)
+    
     def test_get_summary_stats_empty(self, sample_csv_file):
         """Test summary stats for empty results."""
         scanner = BWBScanner(sample_csv_file)
@@ -131,9 +201,9 @@ AAPL,2025-11-30,5,180,call,7.5,8.5,8.0,0.28,0.25"""
 class TestScannerFilters:
     """Test that scanner properly applies all filters."""
     
-    @pytest.fixture
-    def comprehensive_csv(self):
-        """Create CSV with data designed to test all filters."""
+    @pytest.fixture(scope="session")
+    def comprehensive_csv(self, tmp_path_factory):
+        """Write CSV with data designed to test all filters, once per session."""
         data = """symbol,expiry,dte,strike,type,bid,ask,mid,delta,iv
 SPY,2025-11-30,5,440,call,19.0,21.0,20.0,0.70,0.20
 SPY,2025-11-30,5,445,call,14.0,16.0,15.0,0.30,0.20
@@ -146,14 +216,9 @@ SPY,2025-11-30,15,440,call,19.0,21.0,20.0,0.70,0.20
 SPY,2025-11-30,15,445,call,14.0,16.0,15.0,0.30,0.20
 SPY,2025-11-30,15,455,call,4.0,6.0,5.0,0.10,0.20"""
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            f.write(data)
-            temp_path = f.name
-        
-        yield temp_path
-        
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+        path = tmp_path_factory.mktemp("csvs") / "comprehensive_csv.csv"
+        path.write_text(data)
+        return str(path)
     
     def test_dte_filter_applied(self, comprehensive_csv):
         """Test that DTE filter is properly applied."""
@@ -212,9 +277,9 @@ SPY,2025-11-30,15,455,call,4.0,6.0,5.0,0.10,0.20"""
 class TestScannerIntegration:
     """Integration tests for complete scanning workflow."""
     
-    @pytest.fixture
-    def realistic_csv(self):
-        """Create a realistic CSV for integration testing."""
+    @pytest.fixture(scope="session")
+    def realistic_csv(self, tmp_path_factory):
+        """Write a realistic CSV for integration testing, once per session."""
         data = """symbol,expiry,dte,strike,type,bid,ask,mid,delta,iv
 SPY,2025-11-30,5,440,call,92.0,94.0,93.0,0.85,0.20
 SPY,2025-11-30,5,445,call,87.0,89.0,88.0,0.80,0.20
@@ -232,14 +297,9 @@ SPY,2025-11-30,5,500,call,32.0,34.0,33.0,0.25,0.20
 SPY,2025-11-30,5,505,call,27.0,29.0,28.0,0.22,0.20
 SPY,2025-11-30,5,510,call,22.0,24.0,23.0,0.15,0.20"""
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            f.write(data)
-            temp_path = f.name
-        
-        yield temp_path
-        
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+        path = tmp_path_factory.mktemp("csvs") / "realistic_csv.csv"
+        path.write_text(data)
+        return str(path)
     
     def test_end_to_end_scan(self, realistic_csv):
         """Test complete end-to-end scanning workflow."""
@@ -310,66 +370,51 @@ SPY,2025-11-30,5,510,call,22.0,24.0,23.0,0.15,0.20"""
 class TestScannerEdgeCases:
     """Test edge cases and error handling in scanner."""
     
-    def test_empty_results(self):
+    def test_empty_results(self, tmp_path):
         """Test handling when no valid positions are found."""
         data = """symbol,expiry,dte,strike,type,bid,ask,mid,delta,iv
 SPY,2025-11-30,5,440,call,1.5,2.0,1.75,0.10,0.20
 SPY,2025-11-30,5,445,call,0.8,1.0,0.9,0.05,0.20"""
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            f.write(data)
-            temp_path = f.name
+        temp_path = tmp_path / "chain.csv"
+        temp_path.write_text(data)
         
-        try:
-            scanner = BWBScanner(temp_path)
-            results = scanner.scan("SPY", "2025-11-30")
-            
-            assert isinstance(results, pd.DataFrame)
-            assert len(results) == 0
-            
-            # Summary stats should handle empty results
-            stats = scanner.get_summary_stats(results)
-            assert stats["total_positions"] == 0
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        scanner = BWBScanner(temp_path)
+        results = scanner.scan("SPY", "2025-11-30")
+        
+        assert isinstance(results, pd.DataFrame)
+        assert len(results) == 0
+        
+        # Summary stats should handle empty results
+        stats = scanner.get_summary_stats(results)
+        assert stats["total_positions"] == 0
     
-    def test_single_strike(self):
+    def test_single_strike(self, tmp_path):
         """Test handling of chain with only one strike."""
         data = """symbol,expiry,dte,strike,type,bid,ask,mid,delta,iv
 SPY,2025-11-30,5,440,call,14.5,15.5,15.0,0.30,0.20"""
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            f.write(data)
-            temp_path = f.name
+        temp_path = tmp_path / "chain.csv"
+        temp_path.write_text(data)
         
-        try:
-            scanner = BWBScanner(temp_path)
-            results = scanner.scan("SPY", "2025-11-30")
-            
-            # Should return empty results (need 3 strikes minimum)
-            assert len(results) == 0
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        scanner = BWBScanner(temp_path)
+        results = scanner.scan("SPY", "2025-11-30")
+        
+        # Should return empty results (need 3 strikes minimum)
+        assert len(results) == 0
     
-    def test_only_puts_in_chain(self):
+    def test_only_puts_in_chain(self, tmp_path):
         """Test handling when chain only contains puts."""
         data = """symbol,expiry,dte,strike,type,bid,ask,mid,delta,iv
 SPY,2025-11-30,5,440,put,5.0,5.5,5.25,-0.25,0.20
 SPY,2025-11-30,5,445,put,6.0,6.5,6.25,-0.30,0.20
 SPY,2025-11-30,5,450,put,7.0,7.5,7.25,-0.35,0.20"""
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            f.write(data)
-            temp_path = f.name
+        temp_path = tmp_path / "chain.csv"
+        temp_path.write_text(data)
         
-        try:
-            scanner = BWBScanner(temp_path)
-            results = scanner.scan("SPY", "2025-11-30")
-            
-            # Should return empty (we only scan calls)
-            assert len(results) == 0
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
\ No newline at end of file
+        scanner = BWBScanner(temp_path)
+        results = scanner.scan("SPY", "2025-11-30")
+        
+        # Should return empty (we only scan calls)
+        assert len(results) == 0
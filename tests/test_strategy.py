@@ -3,18 +3,28 @@ Tests for BWB strategy validation and calculation logic.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
+from hypothesis import given, settings, strategies as st
+from bwb_scanner import _kernels
+from bwb_scanner.data_generator import OptionsChainGenerator
 from bwb_scanner.strategy import (
     BWBValidator,
     BWBCalculator,
     BWBConstructor,
-    BWBPosition
+    BWBPosition,
+    _round
 )
 
 
 class TestBWBValidator:
     """Test suite for BWBValidator."""
     
+    @pytest.fixture
+    def validator(self):
+        """Default validator used by the predicate tables."""
+        return BWBValidator()
+    
     def test_default_initialization(self):
         """Test validator initializes with correct defaults."""
         validator = BWBValidator()
@@ -39,41 +49,60 @@ class TestBWBValidator:
         assert validator.max_delta == 0.40
         assert validator.min_credit == 1.00
     
-    def test_is_valid_dte(self):
-        """Test DTE validation."""
-        validator = BWBValidator(min_dte=1, max_dte=10)
-        assert validator.is_valid_dte(1) is True
-        assert validator.is_valid_dte(5) is True
-        assert validator.is_valid_dte(10) is True
-        assert validator.is_valid_dte(0) is False
-        assert validator.is_valid_dte(11) is False
-    
-    def test_is_valid_delta(self):
-        """Test delta validation."""
-        validator = BWBValidator(min_delta=0.20, max_delta=0.35)
-        assert validator.is_valid_delta(0.20) is True
-        assert validator.is_valid_delta(0.25) is True
-        assert validator.is_valid_delta(0.35) is True
-        assert validator.is_valid_delta(0.19) is False
-        assert validator.is_valid_delta(0.36) is False
-    
-    def test_is_asymmetric(self):
+    def test_kernel_thresholds(self):
+        """Test thresholds are exposed as floats in kernel argument order."""
+        thresholds = BWBValidator().kernel_thresholds()
+        assert thresholds == (1.0, 10.0, 0.20, 0.35, 0.50)
+        assert all(isinstance(value, float) for value in thresholds)
+    
+    @pytest.mark.parametrize("dte,expected", [
+        (1, True), (5, True), (10, True), (0, False), (11, False)
+    ])
+    def test_is_valid_dte(self, validator, dte, expected):
+        """Test DTE validation (defaults 1-10)."""
+        assert validator.is_valid_dte(dte) is expected
+    
+    @pytest.mark.parametrize("delta,expected", [
+        (0.20, True), (0.25, True), (0.35, True), (0.19, False), (0.36, False)
+    ])
+    def test_is_valid_delta(self, validator, delta, expected):
+        """Test delta validation (defaults 0.20-0.35)."""
+        assert validator.is_valid_delta(delta) is expected
+    
+    @pytest.mark.parametrize("k1,k2,k3,expected", [
+        (440, 445, 455, True),   # 5, 10 - asymmetric
+        (440, 445, 450, False),  # 5, 5 - symmetric
+        (440, 450, 455, True),   # 10, 5 - asymmetric
+    ])
+    def test_is_asymmetric(self, validator, k1, k2, k3, expected):
         """Test asymmetry validation."""
-        validator = BWBValidator()
-        # Asymmetric: (445-440)=5 != (455-445)=10
-        assert validator.is_asymmetric(440, 445, 455) is True
-        # Symmetric: (445-440)=5 == (450-445)=5
-        assert validator.is_asymmetric(440, 445, 450) is False
-        # Asymmetric: (450-440)=10 != (455-450)=5
-        assert validator.is_asymmetric(440, 450, 455) is True
-    
-    def test_is_valid_credit(self):
-        """Test credit validation."""
-        validator = BWBValidator(min_credit=0.50)
-        assert validator.is_valid_credit(0.50) is True
-        assert validator.is_valid_credit(1.00) is True
-        assert validator.is_valid_credit(0.49) is False
-        assert validator.is_valid_credit(0.00) is False
+        assert validator.is_asymmetric(k1, k2, k3) is expected
+    
+    @pytest.mark.parametrize("credit,expected", [
+        (0.50, True), (1.00, True), (0.49, False), (0.00, False)
+    ])
+    def test_is_valid_credit(self, validator, credit, expected):
+        """Test credit validation (default minimum 0.50)."""
+        assert validator.is_valid_credit(credit) is expected
+    
+    def test_validate_batch_matches_predicates(self, validator):
+        """Test the batch mask agrees with the individual predicates."""
+        dte = np.array([5, 0, 5, 5, 5])
+        delta = np.array([0.25, 0.25, 0.40, 0.25, 0.25])
+        credit = np.array([1.00, 1.00, 1.00, 0.49, 1.00])
+        wing_left = np.array([5.0, 5.0, 5.0, 5.0, 5.0])
+        wing_right = np.array([10.0, 10.0, 10.0, 10.0, 5.0])
+        
+        mask = validator.validate_batch(dte, delta, credit, wing_left, wing_right)
+        
+        expected = [
+            validator.is_valid_dte(dte[n])
+            and validator.is_valid_delta(delta[n])
+            and validator.is_asymmetric(0.0, wing_left[n], wing_left[n] + wing_right[n])
+            and validator.is_valid_credit(credit[n])
+            for n in range(len(dte))
+        ]
+        assert mask.tolist() == expected == [True, False, False, False, False]
 
 
 class TestBWBCalculator:
@@ -159,30 +188,60 @@ class TestBWBCalculator:
         assert calculator.calculate_score(100.0, 100.0) == 100.0
         assert calculator.calculate_score(100.0, 0.0) == 100.0  # No loss = max score
     
-    def test_full_payoff_calculation(self):
-        """Test complete payoff calculation for a known BWB."""
+    @pytest.mark.parametrize(
+        "k1,k2,k3,ask_k1,bid_k2,ask_k3,credit,max_profit,max_loss,score",
+        [
+            # Credit = (2 * 8) - 12 - 2 = 2; profit (2 + 5) * 100;
+            # loss above K3 (10 - 5 - 2) * 100
+            (440, 445, 455, 12.0, 8.0, 2.0, 2.0, 700.0, 300.0, 700 / 300 * 100),
+            # Smaller credit widens the upside loss
+            (440, 445, 455, 12.5, 9.0, 4.0, 1.5, 650.0, 350.0, 650 / 350 * 100),
+            # Debit of 2: upside loss (10 - 5 + 2) * 100 exceeds the debit
+            (440, 445, 455, 15.0, 8.0, 3.0, -2.0, 300.0, 700.0, 300 / 700 * 100),
+        ],
+        ids=["credit_2", "credit_1.5", "debit_2"]
+    )
+    def test_full_payoff_calculation(
+        self, k1, k2, k3, ask_k1, bid_k2, ask_k3,
+        credit, max_profit, max_loss, score
+    ):
+        """Test complete payoff calculation for known BWBs."""
         calculator = BWBCalculator()
+        wing_left = k2 - k1
+        wing_right = k3 - k2
         
-        # 440/445/455 BWB
-        # Prices: Long 440 @ $12 ask, Short 2x 445 @ $8 bid, Long 455 @ $2 ask
-        k1, k2, k3 = 440, 445, 455
-        ask_k1, bid_k2, ask_k3 = 12.0, 8.0, 2.0
-        wing_left = k2 - k1  # 5
-        wing_right = k3 - k2  # 10
+        actual_credit = calculator.calculate_credit(ask_k1, bid_k2, ask_k3)
+        actual_profit = calculator.calculate_max_profit(actual_credit, wing_left)
+        actual_loss = calculator.calculate_max_loss(wing_left, wing_right, actual_credit)
         
-        credit = calculator.calculate_credit(ask_k1, bid_k2, ask_k3)
-        max_profit = calculator.calculate_max_profit(credit, wing_left)
-        max_loss = calculator.calculate_max_loss(wing_left, wing_right, credit)
-        score = calculator.calculate_score(max_profit, max_loss)
+        assert actual_credit == credit
+        assert actual_profit == max_profit
+        assert actual_loss == max_loss
+        assert calculator.calculate_score(actual_profit, actual_loss) == pytest.approx(score)
+    
+    def test_evaluate_batch_matches_scalar(self):
+        """Batch evaluation agrees with the scalar methods element-wise."""
+        calculator = BWBCalculator()
+        ask_k1 = np.array([12.0, 12.5, 15.0, 10.0])
+        bid_k2 = np.array([8.0, 9.0, 8.0, 6.0])
+        ask_k3 = np.array([2.0, 4.0, 3.0, 1.0])
+        wing_left = np.array([5.0, 5.0, 5.0, 10.0])
+        wing_right = np.array([10.0, 10.0, 10.0, 5.0])
+        
+        credit, max_profit, max_loss, score = calculator.evaluate_batch(
+            ask_k1, bid_k2, ask_k3, wing_left, wing_right
+        )
         
-        # Credit = (2 * 8) - 12 - 2 = 2
-        assert credit == 2.0
-        # Max profit at K2 = (2 + 5) * 100 = 700
-        assert max_profit == 700.0
-        # Max loss above K3 = (10 - 5 - 2) * 100 = 300
-        assert max_loss == 300.0
-        # Score = 700 / 300 * 100 = 233.33
-        assert score == pytest.approx(233.33, rel=0.01)
+        for n in range(len(ask_k1)):
+            expected_credit = calculator.calculate_credit(ask_k1[n], bid_k2[n], ask_k3[n])
+            expected_profit = calculator.calculate_max_profit(expected_credit, wing_left[n])
+            expected_loss = calculator.calculate_max_loss(
+                wing_left[n], wing_right[n], expected_credit
+            )
+            assert credit[n] == expected_credit
+            assert max_profit[n] == expected_profit
+            assert max_loss[n] == expected_loss
+            assert score[n] == calculator.calculate_score(expected_profit, expected_loss)
 
 
 class TestBWBConstructor:
@@ -213,6 +272,20 @@ class TestBWBConstructor:
         assert result["strike"] == 445.0
         assert result["delta"] == 0.30
     
+    def test_get_strike_data_matches_filter(self, sample_chain):
+        """Test the cached strike index returns the first matching row."""
+        constructor = BWBConstructor()
+        for strike in sample_chain["strike"]:
+            expected = sample_chain[sample_chain["strike"] == strike].iloc[0]
+            pd.testing.assert_series_equal(
+                constructor._get_strike_data(sample_chain, strike), expected
+            )
+        
+        # A different chain object is re-indexed, keeping the first duplicate
+        duplicated = pd.concat([sample_chain.iloc[[1]], sample_chain])
+        duplicated = duplicated.assign(bid=[99.0] + list(sample_chain["bid"]))
+        assert constructor._get_strike_data(duplicated, 445.0)["bid"] == 99.0
+    
     def test_get_strike_data_not_exists(self, sample_chain):
         """Test retrieving data for non-existent strike."""
         constructor = BWBConstructor()
@@ -252,10 +325,64 @@ class TestBWBConstructor:
         constructor = BWBConstructor()
         positions = constructor.find_all_combinations(sample_chain)
         assert isinstance(positions, list)
-        for pos in positions:
-            assert isinstance(pos, BWBPosition)
-            assert abs(pos.wing_left - pos.wing_right) > 0.001
-            assert pos.credit >= 0.50
+        assert all(isinstance(pos, BWBPosition) for pos in positions)
+        
+        # Check the filters over whole field arrays at once
+        wing_left = np.array([pos.wing_left for pos in positions], dtype=np.float64)
+        wing_right = np.array([pos.wing_right for pos in positions], dtype=np.float64)
+        credit = np.array([pos.credit for pos in positions], dtype=np.float64)
+        assert np.all(np.abs(wing_left - wing_right) > 0.001)
+        assert np.all(credit >= 0.50)
+
+    def test_find_all_combinations_matches_build_position(self, sample_chain):
+        """Test vectorized construction matches per-triple _build_position."""
+        constructor = BWBConstructor(validator=BWBValidator(min_credit=-100.0))
+        strikes = sorted(sample_chain["strike"].unique())
+        expected = []
+        for i, k1 in enumerate(strikes):
+            for j, k2 in enumerate(strikes[i+1:], start=i+1):
+                for k3 in strikes[j+1:]:
+                    position = constructor._build_position(sample_chain, k1, k2, k3)
+                    if position is not None:
+                        expected.append(position)
+        
+        positions = constructor.find_all_combinations(sample_chain)
+        assert len(expected) > 0
+        assert positions == expected
+
+    
+    def test_find_all_combinations_cols_matches_rows(self, sample_chain):
+        """Test column output holds the same values as the row dictionaries."""
+        constructor = BWBConstructor(validator=BWBValidator(min_credit=-100.0))
+        arrays = constructor.chain_to_arrays(sample_chain)
+        
+        columns = constructor.find_all_combinations_cols(arrays)
+        rows = constructor.find_all_combinations_arr(arrays)
+        
+        assert len(rows) > 0
+        for key, values in columns.items():
+            assert values.tolist() == [row[key] for row in rows]
+    
+    def test_columns_frame_matches_position_records(self, sample_chain):
+        """Test the columnar export builds the same frame as position records."""
+        constructor = BWBConstructor(validator=BWBValidator(min_credit=-100.0))
+        positions = constructor.find_all_combinations(sample_chain)
+        columns = constructor.find_all_combinations_cols(
+            constructor.chain_to_arrays(sample_chain)
+        )
+        
+        assert len(positions) > 0
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(columns),
+            pd.DataFrame.from_records([p.to_dict() for p in positions])
+        )
+    
+    def test_round_matches_builtin(self):
+        """Test vectorized rounding agrees with round() at half-way points."""
+        values = np.array([2.675, 1.005, 0.125, -0.125, 12.34565, 0.30000000000000004])
+        for ndigits in (2, 4):
+            expected = [round(x, ndigits) for x in values.tolist()]
+            assert _round(values, ndigits).tolist() == expected
 
 
 class TestBWBPosition:
@@ -309,29 +436,147 @@ class TestBWBPosition:
         assert result["k3"] == 455.0
         assert result["credit"] == 2.0
         assert result["score"] == 0.25
+    
+    def test_position_is_slotted(self):
+        """Test positions store their fields in slots, without a __dict__."""
+        position = BWBPosition(
+            ticker="SPY",
+            expiry="2025-11-30",
+            dte=5,
+            k1=440.0,
+            k2=445.0,
+            k3=455.0,
+            wing_left=5.0,
+            wing_right=10.0,
+            credit=2.0,
+            max_profit=200.0,
+            max_loss=800.0,
+            score=0.25
+        )
+        
+        assert not hasattr(position, "__dict__")
+        assert BWBPosition.__slots__ == tuple(position.to_dict())
 
 
 class TestPayoffMath:
     """Test suite for verifying payoff mathematics with known examples."""
     
-    def test_known_example_1(self):
-        """Test 440/445/455 call BWB with $2 credit."""
-        calculator = BWBCalculator()
-        
-        k1, k2, k3 = 440, 445, 455
-        wing_left = k2 - k1  # 5
-        wing_right = k3 - k2  # 10
-        ask_k1, bid_k2, ask_k3 = 12.0, 8.0, 2.0
-        
-        credit = calculator.calculate_credit(ask_k1, bid_k2, ask_k3)
-        max_profit = calculator.calculate_max_profit(credit, wing_left)
-        max_loss = calculator.calculate_max_loss(wing_left, wing_right, credit)
-        score = calculator.calculate_score(max_profit, max_loss)
-        
-        assert credit == 2.0
-        assert max_profit == 700.0  # (2 + 5) * 100
-        assert max_loss == 300.0  # (10 - 5 - 2) * 100
-        assert score == pytest.approx(233.33, rel=0.01)
+    @pytest.mark.parametrize("min_credit", [-100.0, 0.50])
+    def test_numpy_kernel_matches_compiled(self, min_credit):
+        """Test the NumPy fallback reproduces the compiled kernel exactly."""
+        chain = OptionsChainGenerator(ticker="SPY").generate_chain(
+            spot_price=450.0, dte_list=[5], num_strikes=60
+        )
+        arrays = BWBConstructor.chain_to_arrays(chain[chain["type"] == "call"])
+        args = [
+            np.asarray(arrays[col], dtype=np.float64)
+            for col in ("strike", "bid", "ask", "delta", "dte")
+        ]
+        thresholds = BWBValidator(min_credit=min_credit).kernel_thresholds()
+        
+        compiled = _kernels.find_combos(*args, *thresholds)
+        fallback = _kernels._find_combos_numpy(*args, *thresholds)
+        
+        assert len(compiled[0]) > 0
+        for expected, actual in zip(compiled, fallback):
+            np.testing.assert_array_equal(actual, expected)
+    
+    @pytest.mark.parametrize(
+        "find_combos",
+        [_kernels.find_combos, _kernels._find_combos_numpy],
+        ids=["compiled", "numpy"]
+    )
+    def test_known_examples_batch(self, find_combos):
+        """Test the vectorized kernels reproduce every known example at once."""
+        # (k1, k2, k3), (ask_k1, bid_k2, ask_k3)
+        examples = [
+            ((440, 445, 455), (12.0, 8.0, 2.0)),
+            ((450, 460, 465), (18.0, 12.0, 6.0)),
+            ((450, 460, 465), (16.0, 12.0, 5.0)),
+        ]
+        no_filters = (0.0, 100.0, 0.0, 1.0, -np.inf)
+        
+        results = []
+        for strikes, (ask_k1, bid_k2, ask_k3) in examples:
+            i, j, k, *metrics = find_combos(
+                np.array(strikes, dtype=np.float64),
+                np.array([0.0, bid_k2, 0.0]),
+                np.array([ask_k1, bid_k2, ask_k3]),
+                np.array([0.50, 0.30, 0.10]),
+                np.array([5.0, 5.0, 5.0]),
+                *no_filters
+            )
+            assert (list(i), list(j), list(k)) == ([0], [1], [2])
+            results.append([metric[0] for metric in metrics])
+        
+        credit, max_profit, max_loss, score = np.array(results).T
+        np.testing.assert_allclose(credit, [2.0, 0.0, 3.0])
+        np.testing.assert_allclose(max_profit, [700.0, 1000.0, 1300.0])
+        np.testing.assert_allclose(max_loss, [300.0, 0.0, 0.0])
+        np.testing.assert_allclose(score, [700.0 / 3.0, 100.0, 100.0])
+
+
+# Strikes on a $0.50 grid keep wing widths exact in binary floating point
+half_dollars = st.integers(min_value=1, max_value=40).map(lambda n: n / 2)
+
+
+@st.composite
+def call_chains(draw):
+    """Draw a small single-expiry call chain with arbitrary quotes."""
+    n = draw(st.integers(min_value=3, max_value=10))
+    strikes = draw(st.lists(
+        st.integers(min_value=800, max_value=1000), min_size=n, max_size=n, unique=True
+    ))
+    cents = st.integers(min_value=0, max_value=3000).map(lambda c: c / 100)
+    bids = draw(st.lists(cents, min_size=n, max_size=n))
+    spreads = draw(st.lists(cents, min_size=n, max_size=n))
+    return pd.DataFrame({
+        "symbol": ["SPY"] * n,
+        "expiry": ["2025-11-30"] * n,
+        "dte": draw(st.lists(st.integers(0, 15), min_size=n, max_size=n)),
+        "strike": [strike / 2 for strike in strikes],
+        "type": ["call"] * n,
+        "bid": bids,
+        "ask": [bid + spread for bid, spread in zip(bids, spreads)],
+        "mid": [bid + spread / 2 for bid, spread in zip(bids, spreads)],
+        "delta": draw(st.lists(
+            st.floats(min_value=0.0, max_value=1.0), min_size=n, max_size=n
+        )),
+        "iv": [0.20] * n
+    })
+
+
+class TestProperties:
+    """Property-based checks over generated strikes and chains."""
+    
+    @given(offset=half_dollars, wing_left=half_dollars, wing_right=half_dollars)
+    @settings(max_examples=500, deadline=50)
+    def test_asymmetry_matches_wing_widths(self, offset, wing_left, wing_right):
+        """Test is_asymmetric is exactly unequal wing widths."""
+        k1 = 400 + offset
+        k2 = k1 + wing_left
+        k3 = k2 + wing_right
+        validator = BWBValidator()
+        assert validator.is_asymmetric(k1, k2, k3) is (wing_left != wing_right)
+    
+    # No deadline: the first example may pay for kernel compilation
+    @given(chain=call_chains(), min_credit=st.sampled_from([-5.0, 0.0, 0.50]))
+    @settings(max_examples=200, deadline=None)
+    def test_kernel_matches_build_position(self, chain, min_credit):
+        """Test vectorized construction matches _build_position on any chain."""
+        constructor = BWBConstructor(
+            validator=BWBValidator(max_dte=10, min_credit=min_credit)
+        )
+        strikes = sorted(chain["strike"])
+        expected = []
+        for i, k1 in enumerate(strikes):
+            for j, k2 in enumerate(strikes[i+1:], start=i+1):
+                for k3 in strikes[j+1:]:
+                    position = constructor._build_position(chain, k1, k2, k3)
+                    if position is not None:
+                        expected.append(position)
+        
+        assert constructor.find_all_combinations(chain) == expected
 
 
 class TestPayoffAtUnderlying:
@@ -390,6 +635,28 @@ class TestPayoffAtUnderlying:
         assert payoff_460 == -300.0
         assert payoff_500 == -300.0
     
+    def test_payoff_over_spot_grid(self):
+        """payoff_curve prices a whole spot grid in one call."""
+        spots = np.array([430.0, 440.0, 445.0, 450.0, 455.0, 500.0])
+        payoffs = BWBCalculator.payoff_curve(spots, 440, 445, 455, 2.0)
+        expected = [200.0, 200.0, 700.0, 200.0, -300.0, -300.0]
+        np.testing.assert_array_equal(payoffs, expected)
+    
+    @pytest.mark.parametrize("k1,k2,k3,credit", [
+        (440, 445, 455, 2.0),    # right wing wider
+        (440, 450, 455, 2.0),    # left wing wider
+        (440, 445, 455, -1.5),   # debit
+    ])
+    def test_payoff_curve_matches_scalar(self, k1, k2, k3, credit):
+        """payoff_curve prices a spot grid exactly as the scalar reference."""
+        spots = np.arange(420.0, 480.5, 0.5)
+        payoffs = BWBCalculator.payoff_curve(spots, k1, k2, k3, credit)
+        expected = [
+            self.calculate_payoff_at_expiry(spot, k1, k2, k3, credit)
+            for spot in spots.tolist()
+        ]
+        np.testing.assert_array_equal(payoffs, expected)
+    
     def test_max_profit_matches_calculator(self):
         """Verify calculator's max_profit matches actual payoff at K2."""
         k1, k2, k3, credit = 440, 445, 455, 2.0
@@ -501,57 +768,46 @@ class TestFilters:
         }
         return pd.DataFrame(data)
     
-    def test_dte_filter(self, mixed_chain):
+    @pytest.fixture
+    def validator(self):
+        """Validator with a 5-10 DTE window used by the filter tables."""
+        return BWBValidator(min_dte=5, max_dte=10)
+    
+    @pytest.mark.parametrize("dte,expected", [
+        (1, False),   # below the window
+        (5, True),
+        (10, True),
+        (15, False),  # above the window
+        (20, False),
+    ])
+    def test_dte_filter(self, validator, dte, expected):
         """Test that DTE filter works correctly."""
-        validator = BWBValidator(min_dte=5, max_dte=10)
-        
-        # DTE 1 should be rejected
-        assert validator.is_valid_dte(1) is False
-        # DTE 5 and 10 should be accepted
-        assert validator.is_valid_dte(5) is True
-        assert validator.is_valid_dte(10) is True
-        # DTE 15+ should be rejected
-        assert validator.is_valid_dte(15) is False
-        assert validator.is_valid_dte(20) is False
-    
-    def test_delta_filter(self, mixed_chain):
+        assert validator.is_valid_dte(dte) is expected
+    
+    @pytest.mark.parametrize("delta,expected", [
+        (0.15, False), (0.20, True), (0.30, True), (0.50, False)
+    ])
+    def test_delta_filter(self, validator, delta, expected):
         """Test that delta filter works correctly."""
-        validator = BWBValidator(min_delta=0.20, max_delta=0.35)
-        
-        # Delta 0.15 should be rejected
-        assert validator.is_valid_delta(0.15) is False
-        # Delta 0.20 and 0.30 should be accepted
-        assert validator.is_valid_delta(0.20) is True
-        assert validator.is_valid_delta(0.30) is True
-        # Delta 0.50 should be rejected
-        assert validator.is_valid_delta(0.50) is False
+        assert validator.is_valid_delta(delta) is expected
     
-    def test_credit_filter(self):
+    @pytest.mark.parametrize("credit,expected", [
+        (0.49, False), (0.50, True), (1.00, True), (0.00, False), (-1.00, False)
+    ])
+    def test_credit_filter(self, validator, credit, expected):
         """Test that credit filter works correctly."""
-        validator = BWBValidator(min_credit=0.50)
-        
-        assert validator.is_valid_credit(0.49) is False
-        assert validator.is_valid_credit(0.50) is True
-        assert validator.is_valid_credit(1.00) is True
-        assert validator.is_valid_credit(0.00) is False
-        assert validator.is_valid_credit(-1.00) is False
-    
-    def test_asymmetry_filter(self):
+        assert validator.is_valid_credit(credit) is expected
+    
+    @pytest.mark.parametrize("k1,k2,k3,expected", [
+        (440, 445, 450, False),  # 5, 5 - symmetric
+        (440, 445, 455, True),   # 5, 10 - asymmetric
+        (440, 450, 455, True),   # 10, 5 - asymmetric
+        (440, 445, 460, True),   # 5, 15 - asymmetric
+        (440, 450, 460, False),  # 10, 10 - symmetric
+    ])
+    def test_asymmetry_filter(self, validator, k1, k2, k3, expected):
         """Test that asymmetry filter works correctly."""
-        validator = BWBValidator()
-        
-        # Test various wing combinations
-        test_cases = [
-            (440, 445, 450, False),  # 5, 5 - symmetric
-            (440, 445, 455, True),   # 5, 10 - asymmetric
-            (440, 450, 455, True),   # 10, 5 - asymmetric
-            (440, 445, 460, True),   # 5, 15 - asymmetric
-            (440, 450, 460, False),  # 10, 10 - symmetric
-        ]
-        
-        for k1, k2, k3, expected in test_cases:
-            result = validator.is_asymmetric(k1, k2, k3)
-            assert result == expected, f"Failed for {k1}/{k2}/{k3}"
+        assert validator.is_asymmetric(k1, k2, k3) is expected
     
     def test_combined_filters(self, mixed_chain):
         """Test that all filters work together correctly."""